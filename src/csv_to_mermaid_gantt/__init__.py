@@ -9,11 +9,72 @@ Supports multiple CSV formats:
 Timestamps can be in ISO 8601 format or Unix timestamps (seconds since epoch).
 """
 
-import argparse
+import codecs
+import contextlib
 import csv
+import functools
+import itertools
+import mmap
+import os
+import re
+import stat
 import sys
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Dict,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+# Optional SIMD-accelerated CSV parser, used by parse_csv when installed
+_cisv: Optional[Any]
+try:
+    import cisv as _cisv  # type: ignore[import-not-found, no-redef, unused-ignore]
+except ImportError:  # pragma: no cover - depends on installed packages
+    _cisv = None
+
+# Alternative column names mapped to the normalized task field names
+_FIELD_ALIASES = {"Name": "task_name"}
+
+# Timestamp columns and the date/time fields they are expanded into
+_TIMESTAMP_FIELDS = (
+    ("start_timestamp", "start_date", "start_time"),
+    ("end_timestamp", "end_date", "end_time"),
+)
+
+# Task statuses supported by Mermaid Gantt charts
+_VALID_STATUSES = frozenset(("active", "done", "crit", "milestone"))
+
+# Mermaid init directive setting the diagram width (%-format, takes the width)
+_INIT_DIRECTIVE_TEMPLATE = (
+    "%%%%{init: {'theme':'default', "
+    "'themeVariables': {'fontSize': '16px'}, "
+    "'gantt': {'useWidth': %d}}}%%%%"
+)
+
+# ISO 8601 shapes accepted by the strptime formats in parse_timestamp. Newer
+# Python versions let datetime.fromisoformat accept more forms (e.g. without
+# seconds), so it is only used for values of these shapes.
+_ISO_TIMESTAMP_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:T\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?Z?| \d{2}:\d{2}:\d{2}(?:\.\d{1,6})?)?",
+    re.ASCII,
+)
+
+# Translation table mapping spaces and hyphens to underscores in task IDs
+_TASK_ID_TABLE = str.maketrans({" ": "_", "-": "_"})
+
+# Characters making up a CSV line with no values (whitespace and separators)
+_BLANK_ROW_CHARS = " \t\r\n\x0b\x0c,"
+
+# Buffer size for output files, so large charts are written in few syscalls
+_OUTPUT_BUFFER_SIZE = 1 << 20
 
 
 def log_verbose(message: str, verbose: bool = False) -> None:
@@ -41,14 +102,38 @@ def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
 
     timestamp_str = timestamp_str.strip()
 
-    # Try Unix timestamp (seconds since epoch)
+    # Fast path: integer Unix timestamp (seconds since epoch)
+    if timestamp_str.isdigit():
+        try:
+            return datetime.fromtimestamp(int(timestamp_str))
+        except (ValueError, OSError, OverflowError):
+            pass
+
+    # Fast path: date only (YYYY-MM-DD)
+    if len(timestamp_str) == 10 and timestamp_str[4] == "-" and timestamp_str[7] == "-":
+        try:
+            return datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            pass
+
+    # Try Unix timestamp with fractional seconds or a sign
     try:
         timestamp_float = float(timestamp_str)
         return datetime.fromtimestamp(timestamp_float)
     except (ValueError, OSError):
         pass
 
-    # Try various ISO 8601 formats
+    # Fast path: datetime.fromisoformat is implemented in C and handles the
+    # shapes of the strptime formats below directly. A trailing "Z" is dropped
+    # so the result stays naive, matching those formats.
+    if _ISO_TIMESTAMP_RE.fullmatch(timestamp_str):
+        iso_str = timestamp_str.rstrip("Z")
+        try:
+            return datetime.fromisoformat(iso_str)
+        except ValueError:
+            pass
+
+    # Fall back to explicit ISO 8601 formats
     iso_formats = [
         "%Y-%m-%dT%H:%M:%S.%fZ",  # 2024-01-01T12:30:45.123456Z
         "%Y-%m-%dT%H:%M:%SZ",  # 2024-01-01T12:30:45Z
@@ -68,7 +153,89 @@ def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
     return None
 
 
-def normalize_task_dict(task: Dict[str, str], verbose: bool = False) -> Dict[str, str]:
+def _parse_unix_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse an integer Unix timestamp, falling back to parse_timestamp.
+
+    Args:
+        timestamp_str: Timestamp string, expected to be an integer Unix timestamp
+
+    Returns:
+        Datetime object or None if parsing fails
+    """
+    value = timestamp_str.strip()
+    if value.isdigit():
+        try:
+            return datetime.fromtimestamp(int(value))
+        except (ValueError, OSError, OverflowError):
+            pass
+    return parse_timestamp(timestamp_str)
+
+
+def _parse_iso_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, falling back to parse_timestamp.
+
+    Args:
+        timestamp_str: Timestamp string, expected to be in ISO 8601 format
+
+    Returns:
+        Datetime object or None if parsing fails
+    """
+    value = timestamp_str.strip()
+    # Only shapes parse_timestamp accepts are parsed directly. All-digit
+    # values are left to it as Unix timestamps, even where fromisoformat would
+    # read them as compact dates such as "20240101".
+    if _ISO_TIMESTAMP_RE.fullmatch(value) and not value.endswith("Z"):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return parse_timestamp(timestamp_str)
+
+
+def _select_timestamp_parser(sample: str) -> Callable[[str], Optional[datetime]]:
+    """Select a timestamp parser specialized for the format of a sample value.
+
+    The specialized parsers skip the fallback chain of parse_timestamp for the
+    detected format, and still defer to it for values in any other format.
+
+    Args:
+        sample: Representative timestamp value from the CSV
+
+    Returns:
+        Timestamp parsing function
+    """
+    sample = sample.strip()
+    if sample.isdigit():
+        return _parse_unix_timestamp
+    if _ISO_TIMESTAMP_RE.fullmatch(sample) and not sample.endswith("Z"):
+        return _parse_iso_timestamp
+    return parse_timestamp
+
+
+def _split_datetime(dt: datetime) -> Tuple[str, str]:
+    """Format a datetime as separate YYYY-MM-DD date and HH:MM:SS time strings.
+
+    Equivalent to strftime("%Y-%m-%d") and strftime("%H:%M:%S"), but formats
+    the fields directly instead of going through strftime twice.
+
+    Args:
+        dt: Datetime to format
+
+    Returns:
+        Tuple of (date string, time string)
+    """
+    # Dates repeat across most tasks, so share one string object per date
+    return (
+        sys.intern(f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"),
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}",
+    )
+
+
+def normalize_task_dict(
+    task: Dict[str, str],
+    verbose: bool = False,
+    timestamp_parser: Callable[[str], Optional[datetime]] = parse_timestamp,
+) -> Dict[str, str]:
     """Normalize task dictionary to use consistent field names.
 
     Converts 'Name' to 'task_name' and timestamp fields to date fields.
@@ -76,47 +243,91 @@ def normalize_task_dict(task: Dict[str, str], verbose: bool = False) -> Dict[str
     Args:
         task: Task dictionary with potentially varied field names
         verbose: Whether to print verbose logging messages
+        timestamp_parser: Function used to parse timestamp fields
 
     Returns:
         Normalized task dictionary
     """
-    normalized = dict(task)
-    log_verbose(f"Normalizing task with fields: {list(task.keys())}", verbose)
+    return _normalize_task_in_place(dict(task), verbose, timestamp_parser)
 
-    # Convert 'Name' to 'task_name' for consistency
-    if "Name" in normalized and "task_name" not in normalized:
-        normalized["task_name"] = normalized["Name"]
-        log_verbose(
-            f"Converted 'Name' field to 'task_name': {normalized['task_name']}", verbose
-        )
 
-    # Handle timestamp-based format (Name,start_timestamp,end_timestamp)
-    if "start_timestamp" in normalized:
-        start_dt = parse_timestamp(normalized["start_timestamp"])
-        if start_dt:
-            # Use second precision for digital forensics
-            normalized["start_date"] = start_dt.strftime("%Y-%m-%d")
-            normalized["start_time"] = start_dt.strftime("%H:%M:%S")
+def _normalize_task_in_place(
+    normalized: Dict[str, str],
+    verbose: bool,
+    timestamp_parser: Callable[[str], Optional[datetime]],
+) -> Dict[str, str]:
+    """Normalize a task dictionary owned by the caller without copying it.
+
+    Args:
+        normalized: Task dictionary to update in place
+        verbose: Whether to print verbose logging messages
+        timestamp_parser: Function used to parse timestamp fields
+
+    Returns:
+        The same task dictionary, normalized
+    """
+    log_verbose(f"Normalizing task with fields: {list(normalized.keys())}", verbose)
+
+    # Convert aliases such as 'Name' to 'task_name' for consistency
+    for alias, field in _FIELD_ALIASES.items():
+        if alias in normalized and field not in normalized:
+            normalized[field] = normalized[alias]
             log_verbose(
-                f"Parsed start_timestamp: "
-                f"{normalized['start_date']} {normalized['start_time']}",
+                f"Converted '{alias}' field to '{field}': {normalized[field]}",
                 verbose,
             )
 
-    if "end_timestamp" in normalized:
-        end_dt = parse_timestamp(normalized["end_timestamp"])
-        if end_dt:
-            normalized["end_date"] = end_dt.strftime("%Y-%m-%d")
-            normalized["end_time"] = end_dt.strftime("%H:%M:%S")
+    # Handle timestamp-based format (Name,start_timestamp,end_timestamp)
+    for timestamp_field, date_field, time_field in _TIMESTAMP_FIELDS:
+        if timestamp_field not in normalized:
+            continue
+        dt = timestamp_parser(normalized[timestamp_field])
+        if dt:
+            # Use second precision for digital forensics
+            normalized[date_field], normalized[time_field] = _split_datetime(dt)
             log_verbose(
-                f"Parsed end_timestamp: "
-                f"{normalized['end_date']} {normalized['end_time']}",
+                f"Parsed {timestamp_field}: "
+                f"{normalized[date_field]} {normalized[time_field]}",
                 verbose,
             )
 
     return normalized
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_header(header_line: str) -> Tuple[str, ...]:
+    """Parse a CSV header line into its field names.
+
+    Results are cached, since the same few header layouts are parsed
+    repeatedly when converting many files.
+
+    Args:
+        header_line: First line of the CSV content
+
+    Returns:
+        Tuple of header field names
+    """
+    return tuple(next(csv.reader([header_line]), []))
+
+
+def _iter_csv_rows(lines: Iterable[str]) -> Iterator[List[str]]:
+    """Read CSV rows from lines, reporting malformed CSV as a ValueError.
+
+    Args:
+        lines: CSV lines without line endings
+
+    Yields:
+        Rows of field values
+
+    Raises:
+        ValueError: If the CSV cannot be parsed
+    """
+    try:
+        yield from csv.reader(lines)
+    except csv.Error as e:
+        raise ValueError(f"Invalid CSV format: {e}") from e
+
+
 def parse_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str]]:
     """Parse CSV content and return a list of task dictionaries.
 
@@ -134,20 +345,64 @@ def parse_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str]]:
     if not content:
         raise ValueError("CSV content is empty")
 
-    lines = content.splitlines()
-    reader = csv.DictReader(lines)
+    rows: Iterable[List[str]]
+    if _cisv is not None:  # pragma: no cover - optional dependency
+        # Parse everything in one call with the optional native parser
+        all_rows = _cisv.parse_string(
+            content, delimiter=",", quote='"', skip_empty_lines=True
+        )
+        headers = tuple(all_rows[0])
+        rows = itertools.islice(all_rows, 1, None)
+    elif '"' not in content:
+        # Without quotes every line is one row, and plain str.split is enough.
+        # Lines holding only separators and whitespace are dropped up front.
+        lines = content.splitlines()
+        headers = _parse_header(lines[0])
+        rows = (
+            line.split(",")
+            for line in itertools.islice(lines, 1, None)
+            if line.strip(_BLANK_ROW_CHARS)
+        )
+    else:
+        # csv reads the lines without their endings, so \n, \r\n and \r all
+        # work and quoted fields spanning lines are rejoined with "\n"
+        lines = content.splitlines()
+        if '"' in lines[0]:
+            # Quoted headers may span lines, so let csv parse them from the start
+            reader = _iter_csv_rows(lines)
+            headers = tuple(next(reader))
+            rows = reader
+        else:
+            headers = _parse_header(lines[0])
+            rows = _iter_csv_rows(itertools.islice(lines, 1, None))
     tasks = []
 
-    log_verbose(f"CSV headers detected: {reader.fieldnames}", verbose)
+    log_verbose(f"CSV headers detected: {list(headers)}", verbose)
 
-    for idx, row in enumerate(reader):
-        log_verbose(f"Processing row {idx + 1}: {dict(row)}", verbose)
-        # Filter out empty rows where all values are empty strings or None
-        if any(value and value.strip() for value in row.values()):
-            normalized_task = normalize_task_dict(dict(row), verbose)
-            tasks.append(normalized_task)
-        else:
-            log_verbose(f"Skipping empty row {idx + 1}", verbose)
+    # The timestamp parser is chosen once from the first timestamp value
+    timestamp_fields = [field for field, _, _ in _TIMESTAMP_FIELDS if field in headers]
+    timestamp_parser: Optional[Callable[[str], Optional[datetime]]] = None
+
+    # Blank lines produce empty rows and are skipped entirely. Values beyond
+    # the number of headers (malformed rows with extra columns) are dropped.
+    for idx, row in enumerate(filter(None, rows), start=1):
+        # Filter out empty rows where all values are empty or whitespace
+        if not any(map(str.strip, row)):
+            log_verbose(f"Skipping empty row {idx}", verbose)
+            continue
+        task = dict(zip(headers, row))
+        log_verbose(f"Processing row {idx}: {task}", verbose)
+        if timestamp_parser is None:
+            sample = next((task[f] for f in timestamp_fields if task.get(f)), "")
+            if sample.strip():
+                timestamp_parser = _select_timestamp_parser(sample)
+                log_verbose(
+                    f"Using {timestamp_parser.__name__} for timestamp fields", verbose
+                )
+        # The row dict is ours, so normalize it without another copy
+        tasks.append(
+            _normalize_task_in_place(task, verbose, timestamp_parser or parse_timestamp)
+        )
 
     log_verbose(f"Parsed {len(tasks)} task(s) from CSV", verbose)
     return tasks
@@ -178,6 +433,7 @@ def validate_task(task: Dict[str, str]) -> None:
             )
 
 
+@functools.lru_cache(maxsize=4096)
 def format_task_id(task_name: str) -> str:
     """Format task name as a valid Mermaid task ID.
 
@@ -187,7 +443,7 @@ def format_task_id(task_name: str) -> str:
     Returns:
         Formatted task ID (lowercase, underscores for spaces)
     """
-    return task_name.lower().replace(" ", "_").replace("-", "_")
+    return task_name.lower().translate(_TASK_ID_TABLE)
 
 
 def combine_tasks_by_name(
@@ -309,10 +565,28 @@ def combine_tasks_by_name(
     return combined_tasks
 
 
-def generate_mermaid_gantt(
+def _validate_width(width: Optional[int]) -> None:
+    """Validate the optional diagram width.
+
+    Args:
+        width: Optional width in pixels for the diagram
+
+    Raises:
+        ValueError: If width is not an integer between 100 and 10000 pixels
+    """
+    if width is not None:
+        if not isinstance(width, int) or width < 100 or width > 10000:
+            raise ValueError("Width must be an integer between 100 and 10000 pixels")
+
+
+def iter_mermaid_gantt_lines(
     tasks: List[Dict[str, str]], title: str = "Gantt Chart", width: Optional[int] = None
-) -> str:
-    """Generate Mermaid Gantt chart from task data.
+) -> Iterator[str]:
+    """Generate Mermaid Gantt chart lines from task data one at a time.
+
+    Lines are produced lazily, so they can be written out while later tasks
+    are still being formatted. Every task is checked before the first line is
+    yielded, so an invalid task never leaves a partial chart behind.
 
     Args:
         tasks: List of task dictionaries
@@ -320,76 +594,109 @@ def generate_mermaid_gantt(
         width: Optional width in pixels for the diagram (helps with narrow diagrams)
                Must be between 100 and 10000 pixels
 
-    Returns:
-        Mermaid Gantt chart as a string
+    Yields:
+        Lines of the Mermaid Gantt chart, without trailing newlines
 
     Raises:
         ValueError: If tasks list is empty or task data is invalid,
                     or if width is out of valid range
     """
+    _validate_width(width)
+    yield from _iter_gantt_lines(tasks, title, width)
+
+
+def _iter_gantt_lines(
+    tasks: List[Dict[str, str]], title: str, width: Optional[int]
+) -> Iterator[str]:
+    """Generate Mermaid Gantt chart lines for an already validated width.
+
+    Args:
+        tasks: List of task dictionaries
+        title: Title for the Gantt chart
+        width: Optional width in pixels for the diagram, already validated
+
+    Yields:
+        Lines of the Mermaid Gantt chart, without trailing newlines
+
+    Raises:
+        ValueError: If tasks list is empty or task data is invalid
+    """
     if not tasks:
         raise ValueError("No tasks provided")
 
-    # Validate width parameter
-    if width is not None:
-        if not isinstance(width, int) or width < 100 or width > 10000:
-            raise ValueError("Width must be an integer between 100 and 10000 pixels")
+    # Check every task before the first line is produced, so a consumer
+    # writing lines as they arrive never emits part of an invalid chart
+    for task in tasks:
+        if not task.get("task_name", "").strip():
+            # Let validate_task raise its descriptive error for the bad task
+            validate_task(task)
 
     # Determine if we need time precision based on whether start_time or end_time exist
     has_time = any("start_time" in task or "end_time" in task for task in tasks)
 
     # Add configuration directive if width is specified
-    lines = []
     if width is not None:
         # Configure Mermaid to set diagram width and font size for better layout
         # This helps with rendering when exporting to PNG/SVG
-        config = (
-            f"%%{{init: {{'theme':'default', "
-            f"'themeVariables': {{'fontSize': '16px'}}, "
-            f"'gantt': {{'useWidth': {width}}}}}}}%%"
-        )
-        lines.append(config)
+        yield _INIT_DIRECTIVE_TEMPLATE % width
 
+    yield "gantt"
+    yield f"    title {title}"
     if has_time:
-        lines.extend(
-            ["gantt", f"    title {title}", "    dateFormat YYYY-MM-DD HH:mm:ss"]
-        )
+        yield "    dateFormat YYYY-MM-DD HH:mm:ss"
     else:
-        lines.extend(["gantt", f"    title {title}", "    dateFormat YYYY-MM-DD"])
+        yield "    dateFormat YYYY-MM-DD"
 
     for task in tasks:
-        validate_task(task)
-
-        task_name = task["task_name"]
+        task_name = task.get("task_name", "")
         task_id = format_task_id(task_name)
 
-        # Build task line
-        task_line = f"    {task_name} :{task_id}"
-
         # Add status if provided
-        if "status" in task and task["status"].strip():
-            status = task["status"].strip().lower()
-            if status in ["active", "done", "crit"]:
-                task_line += f", {status}"
+        status = task.get("status", "").strip().lower()
+        status_part = f", {status}" if status in _VALID_STATUSES else ""
 
         # Add dates with optional time component
-        if "start_date" in task and task["start_date"].strip():
-            start_date = task["start_date"].strip()
-            if has_time and "start_time" in task and task["start_time"].strip():
-                start_date = f"{start_date} {task['start_time'].strip()}"
-            task_line += f", {start_date}"
+        schedule_part = ""
+        start_date = task.get("start_date", "").strip()
+        if start_date:
+            start_time = task.get("start_time", "").strip() if has_time else ""
+            if start_time:
+                start_date = f"{start_date} {start_time}"
+
+            end_date = task.get("end_date", "").strip()
+            duration = task.get("duration", "").strip()
+            if end_date:
+                end_time = task.get("end_time", "").strip() if has_time else ""
+                if end_time:
+                    end_date = f"{end_date} {end_time}"
+                schedule_part = f", {start_date}, {end_date}"
+            elif duration:
+                schedule_part = f", {start_date}, {duration}"
+            else:
+                schedule_part = f", {start_date}"
 
-            if "end_date" in task and task["end_date"].strip():
-                end_date = task["end_date"].strip()
-                if has_time and "end_time" in task and task["end_time"].strip():
-                    end_date = f"{end_date} {task['end_time'].strip()}"
-                task_line += f", {end_date}"
-            elif "duration" in task and task["duration"].strip():
-                task_line += f", {task['duration'].strip()}"
+        yield f"    {task_name} :{task_id}{status_part}{schedule_part}"
 
-        lines.append(task_line)
 
-    return "\n".join(lines)
+def generate_mermaid_gantt(
+    tasks: List[Dict[str, str]], title: str = "Gantt Chart", width: Optional[int] = None
+) -> str:
+    """Generate Mermaid Gantt chart from task data.
+
+    Args:
+        tasks: List of task dictionaries
+        title: Title for the Gantt chart
+        width: Optional width in pixels for the diagram (helps with narrow diagrams)
+               Must be between 100 and 10000 pixels
+
+    Returns:
+        Mermaid Gantt chart as a string
+
+    Raises:
+        ValueError: If tasks list is empty or task data is invalid,
+                    or if width is out of valid range
+    """
+    return "\n".join(iter_mermaid_gantt_lines(tasks, title, width))
 
 
 def convert_csv_to_mermaid(
@@ -413,7 +720,28 @@ def convert_csv_to_mermaid(
         Mermaid Gantt chart as a string
 
     Raises:
-        ValueError: If CSV format is invalid or task data is invalid
+        ValueError: If CSV format is invalid, task data is invalid,
+                    or width is out of valid range
+    """
+    # Reject an invalid width before doing any parsing work
+    _validate_width(width)
+
+    tasks = _load_tasks(csv_content, verbose, combine_threshold)
+    return "\n".join(_iter_gantt_lines(tasks, title, width))
+
+
+def _load_tasks(
+    csv_content: str, verbose: bool, combine_threshold: Optional[int]
+) -> List[Dict[str, str]]:
+    """Parse CSV content and combine tasks with equal names if requested.
+
+    Args:
+        csv_content: CSV formatted string with task data
+        verbose: Whether to print verbose logging messages
+        combine_threshold: Threshold in seconds for combining tasks, or None
+
+    Returns:
+        List of task dictionaries
     """
     tasks = parse_csv(csv_content, verbose)
 
@@ -424,11 +752,90 @@ def convert_csv_to_mermaid(
         )
         tasks = combine_tasks_by_name(tasks, combine_threshold, verbose)
 
-    return generate_mermaid_gantt(tasks, title, width)
+    return tasks
 
 
-def main() -> None:
-    """Main CLI entry point."""
+def _read_input_file(path: str) -> str:
+    """Read a UTF-8 input file, dropping a leading byte order mark if present.
+
+    Non-empty regular files are memory-mapped and decoded straight from the
+    mapping, so no intermediate bytes copy of the whole file is made. Other
+    inputs such as pipes, FIFOs and procfs files are read normally. Line
+    endings are translated to "\n" as when reading the file in text mode.
+
+    Args:
+        path: Path to the input file
+
+    Returns:
+        Decoded file content
+    """
+    with open(path, "rb") as f:
+        file_stat = os.fstat(f.fileno())
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+            # Only regular files with content can be memory-mapped
+            text = f.read().decode("utf-8-sig")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                bom = codecs.BOM_UTF8
+                start = len(bom) if mapped[: len(bom)] == bom else 0
+                with memoryview(mapped) as view, view[start:] as content:
+                    text = str(content, "utf-8")
+
+    # Universal newlines, matching open(path, encoding="utf-8-sig").read()
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _strip_bom(text: str) -> str:
+    """Drop a leading byte order mark from already decoded text.
+
+    Args:
+        text: Decoded input text
+
+    Returns:
+        Text without a leading byte order mark
+    """
+    return text[1:] if text.startswith("\ufeff") else text
+
+
+def _run(
+    argv: Optional[List[str]], stdin: TextIO, stdout: TextIO, stderr: TextIO
+) -> int:
+    """Run the CLI with explicit arguments and streams.
+
+    Args:
+        argv: Command line arguments (without the program name)
+        stdin: Stream to read CSV input from when no input file is given
+        stdout: Stream to write output to when no output file is given
+        stderr: Stream to write error and verbose messages to
+
+    Returns:
+        Process exit code (0 on success, 1 on error)
+    """
+    # log_verbose and argparse write to sys.stderr, so point it at the given
+    # stream for the duration of the run
+    with contextlib.redirect_stderr(stderr):
+        return _run_cli(argv, stdin, stdout, stderr)
+
+
+def _run_cli(
+    argv: Optional[List[str]], stdin: TextIO, stdout: TextIO, stderr: TextIO
+) -> int:
+    """Parse CLI arguments and run the requested conversion.
+
+    Args:
+        argv: Command line arguments (without the program name)
+        stdin: Stream to read CSV input from when no input file is given
+        stdout: Stream to write output to when no output file is given
+        stderr: Stream to write error messages to
+
+    Returns:
+        Process exit code (0 on success, 1 on error)
+    """
+    # Imported here so library users importing the package don't pay for it
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Convert CSV files to Mermaid Gantt charts or "
@@ -511,7 +918,7 @@ def main() -> None:
         ),
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     verbose = args.verbose
 
     try:
@@ -530,8 +937,7 @@ def main() -> None:
                 log_verbose(f"Reading {len(args.input_file)} input file(s)", verbose)
                 for input_path in args.input_file:
                     log_verbose(f"Reading input from file: {input_path}", verbose)
-                    with open(input_path, "r", encoding="utf-8-sig") as f:
-                        csv_content = f.read()
+                    csv_content = _read_input_file(input_path)
 
                     # Convert log format if specified
                     if args.log_format:
@@ -541,7 +947,7 @@ def main() -> None:
                     csv_files.append({"name": input_path, "content": csv_content})
             else:
                 log_verbose("Reading input from stdin", verbose)
-                csv_content = sys.stdin.read()
+                csv_content = _strip_bom(stdin.read())
 
                 # Convert log format if specified
                 if args.log_format:
@@ -563,31 +969,40 @@ def main() -> None:
                 show_line_graph=not args.no_line_graph,
                 verbose=verbose,
                 combine_threshold=threshold,
+                max_workers=os.cpu_count() or 1,
             )
             log_verbose("HTML generation successful", verbose)
 
             # Write output
             if args.output:
                 log_verbose(f"Writing output to file: {args.output}", verbose)
-                with open(args.output, "w", encoding="utf-8") as f:
+                with open(
+                    args.output, "w", buffering=_OUTPUT_BUFFER_SIZE, encoding="utf-8"
+                ) as f:
                     f.write(html_output)
             else:
-                print(html_output)
+                print(html_output, file=stdout)
 
-            return
+            return 0
 
         # Original Mermaid output mode
+        # Reject an invalid width before reading any input
+        _validate_width(args.width)
+
         # Read input
         if args.input_file:
             # For backward compatibility, take only the first file for Mermaid output
             # args.input_file is always a list due to nargs="*"
             input_path = args.input_file[0]
             log_verbose(f"Reading input from file: {input_path}", verbose)
-            with open(input_path, "r", encoding="utf-8-sig") as f:
-                csv_content = f.read()
+            csv_content = _read_input_file(input_path)
         else:
             log_verbose("Reading input from stdin", verbose)
-            csv_content = sys.stdin.read()
+            csv_content = _strip_bom(stdin.read())
+
+        if not csv_content.strip():
+            print("Error: CSV content is empty", file=stderr)
+            return 1
 
         # Convert log format if specified
         if args.log_format:
@@ -604,28 +1019,43 @@ def main() -> None:
         log_verbose("Starting CSV to Mermaid conversion", verbose)
         # Set threshold to None if 0 is specified (to disable combining)
         threshold = args.combine_threshold if args.combine_threshold > 0 else None
-        mermaid_output = convert_csv_to_mermaid(
-            csv_content, args.title, verbose, args.width, threshold
-        )
-        log_verbose("Conversion successful", verbose)
+        tasks = _load_tasks(csv_content, verbose, threshold)
+        # The generator checks every task before yielding its first line, so
+        # an invalid chart raises before anything is written
+        lines = _iter_gantt_lines(tasks, args.title, args.width)
 
         # Write output
         if args.output:
+            mermaid_output = "\n".join(lines)
+            log_verbose("Conversion successful", verbose)
             log_verbose(f"Writing output to file: {args.output}", verbose)
-            with open(args.output, "w", encoding="utf-8") as f:
+            with open(
+                args.output, "w", buffering=_OUTPUT_BUFFER_SIZE, encoding="utf-8"
+            ) as f:
                 f.write(mermaid_output)
         else:
-            print(mermaid_output)
+            # Stream lines to stdout as they are generated
+            stdout.writelines(f"{line}\n" for line in lines)
+            log_verbose("Conversion successful", verbose)
 
     except FileNotFoundError as e:
-        print(f"Error: File not found - {e}", file=sys.stderr)
-        sys.exit(1)
+        print(f"Error: File not found - {e}", file=stderr)
+        return 1
     except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        print(f"Error: {e}", file=stderr)
+        return 1
     except Exception as e:
-        print(f"Unexpected error: {e}", file=sys.stderr)
-        sys.exit(1)
+        print(f"Unexpected error: {e}", file=stderr)
+        return 1
+
+    return 0
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    exit_code = _run(sys.argv[1:], sys.stdin, sys.stdout, sys.stderr)
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
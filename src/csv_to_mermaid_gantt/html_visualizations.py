@@ -5,10 +5,115 @@ with time-synchronized Timeline Charts (Gantt-like), Line Graphs, and Histograms
 Uses Plotly.js for interactive, zoomable charts with synchronized time axes.
 """
 
-from typing import List, Dict, Optional, Any
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
+import functools
+import itertools
 import json
-from . import parse_csv, parse_timestamp
+import math
+from . import _load_tasks, parse_timestamp
+
+_orjson: Optional[Any]
+try:
+    import orjson as _orjson  # type: ignore[import-not-found, no-redef, unused-ignore]
+except ImportError:  # pragma: no cover - depends on installed packages
+    _orjson = None
+
+# Combined CSV size from which multiple files are parsed in worker processes
+_PARALLEL_MIN_BYTES = 1 << 20
+
+# Parsed (start, end) datetimes of a task
+_TaskTimes = Tuple[Optional[datetime], Optional[datetime]]
+
+# Hours represented by each supported duration suffix
+_DURATION_UNIT_HOURS = {"d": 24.0, "h": 1.0}
+
+
+def _dumps_json(data: Any, non_finite: bool = False) -> str:
+    """Serialize chart data to JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable chart data
+        non_finite: Whether data contains NaN or infinite floats, which orjson
+                    would write as null where json writes NaN and Infinity
+
+    Returns:
+        JSON string
+    """
+    if _orjson is not None and not non_finite:
+        text: str = _orjson.dumps(data).decode("utf-8")
+        return text
+    return json.dumps(data)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_cached_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse a timestamp string, memoizing results for recurring values.
+
+    Start and end times often recur across tasks (back-to-back tasks, files
+    covering the same period), so repeated strings are parsed only once.
+
+    Args:
+        timestamp_str: Timestamp string to parse
+
+    Returns:
+        Parsed datetime object or None if parsing fails
+    """
+    return parse_timestamp(timestamp_str)
+
+
+def _parse_numeric_value(value: str) -> Optional[float]:
+    """Parse a plain number or a duration like "5d"/"24h" into hours.
+
+    Args:
+        value: Field value to parse
+
+    Returns:
+        Numeric value (durations converted to hours) or None if invalid
+    """
+    scale = _DURATION_UNIT_HOURS.get(value[-1])
+    try:
+        if scale is None:
+            return float(value)
+        return float(value[:-1]) * scale
+    except ValueError:
+        return None
+
+
+def _task_timestamp(task: Dict[str, str], prefix: str) -> Optional[datetime]:
+    """Parse a task's start or end timestamp from its date and time fields.
+
+    Args:
+        task: Task dictionary from CSV
+        prefix: Field prefix, either "start" or "end"
+
+    Returns:
+        Parsed datetime object or None if missing or invalid
+    """
+    timestamp_str = task.get(f"{prefix}_date", "")
+    time_str = task.get(f"{prefix}_time")
+    if time_str:
+        timestamp_str = f"{timestamp_str} {time_str}"
+    return _parse_cached_timestamp(timestamp_str) if timestamp_str else None
+
+
+def _enrich_tasks(tasks: List[Dict[str, str]]) -> List[_TaskTimes]:
+    """Parse the start and end timestamps of every task once.
+
+    The result is shared by the timeline, histogram and line graph so that
+    each task's timestamps are parsed a single time for all charts.
+
+    Args:
+        tasks: List of task dictionaries from CSV
+
+    Returns:
+        List of (start, end) datetimes aligned with tasks
+    """
+    return [
+        (_task_timestamp(task, "start"), _task_timestamp(task, "end")) for task in tasks
+    ]
 
 
 def prepare_timeline_data(tasks: List[Dict[str, str]]) -> List[Dict[str, Any]]:
@@ -20,27 +125,28 @@ def prepare_timeline_data(tasks: List[Dict[str, str]]) -> List[Dict[str, Any]]:
     Returns:
         List of timeline data items with start, end, and task name
     """
-    timeline_data = []
+    return _prepare_timeline_data(tasks, _enrich_tasks(tasks))
 
-    for task in tasks:
-        task_name = task.get("task_name", "Unknown")
 
-        # Get start and end timestamps
-        start_str = task.get("start_date", "")
-        if "start_time" in task and task.get("start_time"):
-            start_str = f"{start_str} {task['start_time']}"
+def _prepare_timeline_data(
+    tasks: List[Dict[str, str]], task_times: List[_TaskTimes]
+) -> List[Dict[str, Any]]:
+    """Prepare timeline data from tasks with pre-parsed timestamps.
 
-        end_str = task.get("end_date", "")
-        if "end_time" in task and task.get("end_time"):
-            end_str = f"{end_str} {task['end_time']}"
+    Args:
+        tasks: List of task dictionaries from CSV
+        task_times: Parsed (start, end) datetimes aligned with tasks
 
-        start_dt = parse_timestamp(start_str) if start_str else None
-        end_dt = parse_timestamp(end_str) if end_str else None
+    Returns:
+        List of timeline data items with start, end, and task name
+    """
+    timeline_data = []
 
+    for task, (start_dt, end_dt) in zip(tasks, task_times):
         if start_dt and end_dt:
             timeline_data.append(
                 {
-                    "task": task_name,
+                    "task": task.get("task_name", "Unknown"),
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
                     "start_ts": start_dt.timestamp(),
@@ -63,43 +169,45 @@ def prepare_histogram_data(
     Returns:
         Dictionary with histogram bins and counts
     """
-    if not tasks:
-        return {"bins": [], "counts": []}
+    return _prepare_histogram_data(_enrich_tasks(tasks), bin_size_seconds)
 
-    # Collect all start times
-    start_times = []
-    for task in tasks:
-        start_str = task.get("start_date", "")
-        if "start_time" in task and task.get("start_time"):
-            start_str = f"{start_str} {task['start_time']}"
 
-        start_dt = parse_timestamp(start_str) if start_str else None
-        if start_dt:
-            start_times.append(start_dt.timestamp())
+def _prepare_histogram_data(
+    task_times: List[_TaskTimes], bin_size_seconds: int = 3600
+) -> Dict[str, List[Any]]:
+    """Prepare histogram data from pre-parsed task timestamps.
+
+    Args:
+        task_times: Parsed (start, end) datetimes of the tasks
+        bin_size_seconds: Size of histogram bins in seconds (default: 3600 = 1 hour)
+
+    Returns:
+        Dictionary with histogram bins and counts
+    """
+    # Collect all start times
+    start_times = [start_dt.timestamp() for start_dt, _ in task_times if start_dt]
 
     if not start_times:
         return {"bins": [], "counts": []}
 
-    # Create bins
+    # Bucket each start time by its bin index in a single pass
     min_time = min(start_times)
-    max_time = max(start_times)
+    bin_counts = Counter(int((t - min_time) // bin_size_seconds) for t in start_times)
+    last_bin = max(bin_counts)
 
     bins: List[str] = []
     counts: List[int] = []
 
-    current_bin = min_time
-    while current_bin <= max_time:
-        # Count events in this bin
-        count = sum(
-            1 for t in start_times if current_bin <= t < current_bin + bin_size_seconds
+    for index in sorted(bin_counts):
+        bins.append(
+            datetime.fromtimestamp(min_time + index * bin_size_seconds).isoformat()
         )
-        # Include bins with data or empty bins between data points
-        has_data = count > 0
-        previous_bin_has_data = bins and counts[-1] > 0
-        if has_data or previous_bin_has_data:
-            bins.append(datetime.fromtimestamp(current_bin).isoformat())
-            counts.append(count)
-        current_bin += bin_size_seconds
+        counts.append(bin_counts[index])
+        # Include the empty bin directly following a bin with data
+        if index < last_bin and index + 1 not in bin_counts:
+            bin_start = min_time + (index + 1) * bin_size_seconds
+            bins.append(datetime.fromtimestamp(bin_start).isoformat())
+            counts.append(0)
 
     return {"bins": bins, "counts": counts}
 
@@ -116,119 +224,46 @@ def prepare_line_graph_data(
     Returns:
         Dictionary with timestamps and values for line graph
     """
-    timestamps = []
-    values = []
-
-    for task in tasks:
-        start_str = task.get("start_date", "")
-        if "start_time" in task and task.get("start_time"):
-            start_str = f"{start_str} {task['start_time']}"
-
-        start_dt = parse_timestamp(start_str) if start_str else None
-
-        if start_dt:
-            # Try to extract numeric value from the specified field
-            value = task.get(value_field, "")
-
-            # If it's a duration like "5d", extract the number
-            if value and isinstance(value, str):
-                numeric_value: Optional[float] = None
-                if value.endswith("d"):
-                    try:
-                        numeric_value = float(value[:-1]) * 24
-                    except ValueError:
-                        pass
-                elif value.endswith("h"):
-                    try:
-                        numeric_value = float(value[:-1])
-                    except ValueError:
-                        pass
-                else:
-                    try:
-                        numeric_value = float(value)
-                    except ValueError:
-                        pass
-
-                if numeric_value is not None:
-                    timestamps.append(start_dt.isoformat())
-                    values.append(numeric_value)
-
-    return {"timestamps": timestamps, "values": values}
+    return _prepare_line_graph_data(tasks, _enrich_tasks(tasks), value_field)
 
 
-def generate_html_visualization(
-    csv_files_data: List[Dict[str, Any]],
-    title: str = "Time-Synced Visualizations",
-    show_timeline: bool = True,
-    show_histogram: bool = True,
-    show_line_graph: bool = True,
-) -> str:
-    """Generate interactive HTML with time-synchronized visualizations.
+def _prepare_line_graph_data(
+    tasks: List[Dict[str, str]],
+    task_times: List[_TaskTimes],
+    value_field: str = "duration",
+) -> Dict[str, List[Any]]:
+    """Prepare line graph data from tasks with pre-parsed timestamps.
 
     Args:
-        csv_files_data: List of dictionaries containing CSV data and metadata
-                       Each dict should have:
-                       {"name": str, "tasks": List[Dict[str, str]]}
-        title: Title for the HTML page
-        show_timeline: Whether to include timeline chart
-        show_histogram: Whether to include histogram
-        show_line_graph: Whether to include line graph
+        tasks: List of task dictionaries from CSV
+        task_times: Parsed (start, end) datetimes aligned with tasks
+        value_field: Field name to use for Y-axis values
 
     Returns:
-        HTML string with embedded Plotly.js visualizations
+        Dictionary with timestamps and values for line graph
     """
-    # Prepare data for all visualizations
-    all_timeline_data = []
-    all_histogram_data = []
-    all_line_graph_data = []
-
-    for file_data in csv_files_data:
-        file_name = file_data.get("name", "Unknown")
-        tasks = file_data.get("tasks", [])
+    timestamps = []
+    values = []
 
-        if show_timeline:
-            timeline = prepare_timeline_data(tasks)
-            all_timeline_data.append({"name": file_name, "data": timeline})
+    for task, (start_dt, _) in zip(tasks, task_times):
+        if not start_dt:
+            continue
 
-        if show_histogram:
-            histogram = prepare_histogram_data(tasks)
-            all_histogram_data.append({"name": file_name, "data": histogram})
-
-        if show_line_graph:
-            line_graph = prepare_line_graph_data(tasks)
-            all_line_graph_data.append({"name": file_name, "data": line_graph})
+        # Extract a numeric value from the specified field; durations such as
+        # "5d" are converted to hours
+        value = task.get(value_field, "")
+        if value and isinstance(value, str):
+            numeric_value = _parse_numeric_value(value)
+            if numeric_value is not None:
+                timestamps.append(start_dt.isoformat())
+                values.append(numeric_value)
 
-    # Build file options for the filter dropdown
-    file_options = []
-    for i, file_data in enumerate(csv_files_data):
-        name = file_data.get("name", f"File {i+1}")
-        file_options.append(f'                <option value="{i}">{name}</option>')
-    file_options_html = chr(10).join(file_options)
+    return {"timestamps": timestamps, "values": values}
 
-    # Build chart containers
-    chart_containers = []
-    if show_timeline:
-        chart_containers.append(
-            '<div class="chart-container">'
-            '<div class="chart-title">Timeline Chart (Gantt View)</div>'
-            '<div id="timeline-chart"></div></div>'
-        )
-    if show_histogram:
-        chart_containers.append(
-            '<div class="chart-container">'
-            '<div class="chart-title">Event Histogram</div>'
-            '<div id="histogram-chart"></div></div>'
-        )
-    if show_line_graph:
-        chart_containers.append(
-            '<div class="chart-container">'
-            '<div class="chart-title">Line Graph</div>'
-            '<div id="line-graph-chart"></div></div>'
-        )
-    charts_html = chr(10).join(chart_containers)
 
-    # Generate HTML with embedded Plotly.js
-    html_template = f"""<!DOCTYPE html>
+# Page template for generate_html_visualization; literal braces are doubled
+# for str.format_map
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -313,16 +348,16 @@ placeholder="Enter task name..." oninput="updateFilters()">
 
     <script>
         // Data for visualizations
-        const timelineData = {json.dumps(all_timeline_data)};
-        const histogramData = {json.dumps(all_histogram_data)};
-        const lineGraphData = {json.dumps(all_line_graph_data)};
+        const timelineData = {timeline_json};
+        const histogramData = {histogram_json};
+        const lineGraphData = {line_graph_json};
 
         let currentFileFilter = 'all';
         let currentTaskFilter = '';
 
         // Create timeline chart (Gantt-like)
         function createTimelineChart(filteredData) {{
-            if (!{str(show_timeline).lower()}) return;
+            if (!{show_timeline}) return;
 
             const traces = [];
             filteredData.forEach((fileData, idx) => {{
@@ -369,7 +404,7 @@ placeholder="Enter task name..." oninput="updateFilters()">
 
         // Create histogram chart
         function createHistogramChart(filteredData) {{
-            if (!{str(show_histogram).lower()}) return;
+            if (!{show_histogram}) return;
 
             const traces = filteredData.map((fileData, idx) => ({{
                 x: fileData.data.bins,
@@ -401,7 +436,7 @@ placeholder="Enter task name..." oninput="updateFilters()">
 
         // Create line graph chart
         function createLineGraphChart(filteredData) {{
-            if (!{str(show_line_graph).lower()}) return;
+            if (!{show_line_graph}) return;
 
             const traces = filteredData.map((fileData, idx) => ({{
                 x: fileData.data.timestamps,
@@ -511,7 +546,101 @@ placeholder="Enter task name..." oninput="updateFilters()">
 </body>
 </html>"""
 
-    return html_template
+
+def generate_html_visualization(
+    csv_files_data: List[Dict[str, Any]],
+    title: str = "Time-Synced Visualizations",
+    show_timeline: bool = True,
+    show_histogram: bool = True,
+    show_line_graph: bool = True,
+) -> str:
+    """Generate interactive HTML with time-synchronized visualizations.
+
+    Args:
+        csv_files_data: List of dictionaries containing CSV data and metadata
+                       Each dict should have:
+                       {"name": str, "tasks": List[Dict[str, str]]}
+        title: Title for the HTML page
+        show_timeline: Whether to include timeline chart
+        show_histogram: Whether to include histogram
+        show_line_graph: Whether to include line graph
+
+    Returns:
+        HTML string with embedded Plotly.js visualizations
+    """
+    # Prepare data for all visualizations
+    all_timeline_data = []
+    all_histogram_data = []
+    all_line_graph_data = []
+    # Line graph values come from float() and may be NaN or infinite
+    line_graph_non_finite = False
+
+    for file_data in csv_files_data:
+        file_name = file_data.get("name", "Unknown")
+        tasks = file_data.get("tasks", [])
+
+        # Parse each task's timestamps once for all charts
+        task_times = _enrich_tasks(tasks)
+
+        if show_timeline:
+            timeline = _prepare_timeline_data(tasks, task_times)
+            all_timeline_data.append({"name": file_name, "data": timeline})
+
+        if show_histogram:
+            histogram = _prepare_histogram_data(task_times)
+            all_histogram_data.append({"name": file_name, "data": histogram})
+
+        if show_line_graph:
+            line_graph = _prepare_line_graph_data(tasks, task_times)
+            all_line_graph_data.append({"name": file_name, "data": line_graph})
+            if not line_graph_non_finite:
+                line_graph_non_finite = not all(
+                    map(math.isfinite, line_graph["values"])
+                )
+
+    # Build file options for the filter dropdown
+    file_options = []
+    for i, file_data in enumerate(csv_files_data):
+        name = file_data.get("name", f"File {i+1}")
+        file_options.append(f'                <option value="{i}">{name}</option>')
+    file_options_html = chr(10).join(file_options)
+
+    # Build chart containers
+    chart_containers = []
+    if show_timeline:
+        chart_containers.append(
+            '<div class="chart-container">'
+            '<div class="chart-title">Timeline Chart (Gantt View)</div>'
+            '<div id="timeline-chart"></div></div>'
+        )
+    if show_histogram:
+        chart_containers.append(
+            '<div class="chart-container">'
+            '<div class="chart-title">Event Histogram</div>'
+            '<div id="histogram-chart"></div></div>'
+        )
+    if show_line_graph:
+        chart_containers.append(
+            '<div class="chart-container">'
+            '<div class="chart-title">Line Graph</div>'
+            '<div id="line-graph-chart"></div></div>'
+        )
+    charts_html = chr(10).join(chart_containers)
+
+    # Fill the page template with embedded Plotly.js data in a single pass
+    return _HTML_TEMPLATE.format_map(
+        {
+            "title": title,
+            "file_options_html": file_options_html,
+            "charts_html": charts_html,
+            "timeline_json": _dumps_json(all_timeline_data),
+            "histogram_json": _dumps_json(all_histogram_data),
+            "line_graph_json": _dumps_json(all_line_graph_data, line_graph_non_finite),
+            "show_timeline": str(show_timeline).lower(),
+            "show_histogram": str(show_histogram).lower(),
+            "show_line_graph": str(show_line_graph).lower(),
+        }
+    )
 
 
 def convert_csv_files_to_html(
@@ -522,6 +651,7 @@ def convert_csv_files_to_html(
     show_line_graph: bool = True,
     verbose: bool = False,
     combine_threshold: Optional[int] = 60,
+    max_workers: Optional[int] = None,
 ) -> str:
     """Convert multiple CSV files to HTML with time-synced visualizations.
 
@@ -534,26 +664,46 @@ def convert_csv_files_to_html(
         verbose: Whether to print verbose logging
         combine_threshold: Threshold for combining tasks
                           (passed to parse_csv)
+        max_workers: Maximum number of worker processes used to parse large
+                     inputs of several files, or None to parse in-process.
+                     On platforms that spawn workers, the calling script's
+                     entry point must be guarded by ``if __name__ == "__main__"``
 
     Returns:
         HTML string with time-synced visualizations
     """
-    csv_files_data = []
-
-    for csv_file in csv_files:
-        file_name = csv_file.get("name", "Unknown")
-        csv_content = csv_file.get("content", "")
-
-        # Parse CSV and prepare tasks
-        tasks = parse_csv(csv_content, verbose)
-
-        # Combine tasks if threshold is set
-        if combine_threshold is not None:
-            from . import combine_tasks_by_name
-
-            tasks = combine_tasks_by_name(tasks, combine_threshold, verbose)
-
-        csv_files_data.append({"name": file_name, "tasks": tasks})
+    names = [csv_file.get("name", "Unknown") for csv_file in csv_files]
+    contents = [csv_file.get("content", "") for csv_file in csv_files]
+
+    # Parse files in worker processes only when asked to and when there is
+    # enough work to pay for starting them; verbose runs stay in-process to
+    # keep logs ordered
+    total_size = sum(map(len, contents))
+    if (
+        max_workers is not None
+        and len(contents) >= 2
+        and total_size >= _PARALLEL_MIN_BYTES
+        and not verbose
+    ):
+        with ProcessPoolExecutor(
+            max_workers=min(len(contents), max_workers)
+        ) as executor:
+            all_tasks = list(
+                executor.map(
+                    _load_tasks,
+                    contents,
+                    itertools.repeat(verbose),
+                    itertools.repeat(combine_threshold),
+                )
+            )
+    else:
+        all_tasks = [
+            _load_tasks(content, verbose, combine_threshold) for content in contents
+        ]
+
+    csv_files_data: List[Dict[str, Any]] = [
+        {"name": name, "tasks": tasks} for name, tasks in zip(names, all_tasks)
+    ]
 
     return generate_html_visualization(
         csv_files_data,
@@ -16,10 +16,44 @@ Connections are matched based on: local_ip:local_port,remote_ip:remote_port
 """
 
 import csv
+import functools
+import io
+import itertools
+import operator
 import re
 import sys
 from datetime import datetime
-from typing import List, Dict, Optional, Set
+from typing import (
+    List,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+# Standard log header in the column order written by the logger
+_CANONICAL_HEADERS = [
+    "Date",
+    "Time",
+    "Action",
+    "Process",
+    "Protocol",
+    "LocalAddr",
+    "RemoteAddr",
+]
+
+# Connection identifier as a (local address, remote address) pair
+_ConnectionKey = Tuple[str, str]
+
+# Data rows read ahead of the header check to validate column counts
+_LOOKAHEAD_ROWS = 10
+
+# Extracts the output columns from a matched connection in CSV order
+_CONNECTION_FIELDS = operator.itemgetter("Name", "start_timestamp", "end_timestamp")
 
 
 def log_verbose(message: str, verbose: bool = False) -> None:
@@ -336,11 +370,15 @@ def _auto_detect_headers(
     return mapping
 
 
+@functools.lru_cache(maxsize=65536)
 def parse_log_timestamp(
     date_str: str, time_str: str, default_date: str = "01/01/1970"
 ) -> Optional[datetime]:
     """Parse log timestamp from date and time strings.
 
+    Results are cached, since log rows share dates and several events are
+    often logged within the same second.
+
     Args:
         date_str: Date in DD/MM/YYYY or other formats (can be empty)
         time_str: Time in HH.MM.SS, HH:MM:SS or other formats
@@ -362,6 +400,28 @@ def parse_log_timestamp(
     # Normalize time string (replace . or - with :)
     time_normalized = time_str.replace(".", ":").replace("-", ":")
 
+    # Fast path for the logger's own DD/MM/YYYY HH:MM:SS layout: slice the
+    # fixed-width fields directly instead of going through strptime
+    if (
+        len(date_str) == 10
+        and date_str[2] == date_str[5] == "/"
+        and len(time_normalized) == 8
+        and time_normalized[2] == time_normalized[5] == ":"
+        and f"{date_str}{time_normalized}".replace("/", "").replace(":", "").isdigit()
+    ):
+        try:
+            return datetime(
+                int(date_str[6:]),
+                int(date_str[3:5]),
+                int(date_str[:2]),
+                int(time_normalized[:2]),
+                int(time_normalized[3:5]),
+                int(time_normalized[6:]),
+            )
+        except ValueError:
+            # Not a valid DD/MM/YYYY date (e.g. MM/DD/YYYY); use the formats
+            pass
+
     # Try various date formats in order of preference
     # Note: DD/MM/YYYY vs MM/DD/YYYY is ambiguous for dates like 01/02/2025.
     # We try DD/MM/YYYY first as it's more common internationally.
@@ -396,6 +456,24 @@ def parse_log_timestamp(
     return None
 
 
+def _format_timestamp(dt: datetime) -> str:
+    """Format datetime as YYYY-MM-DD HH:MM:SS.
+
+    Equivalent to dt.strftime("%Y-%m-%d %H:%M:%S") but avoids the
+    locale-aware strftime machinery, since it runs once per output row.
+
+    Args:
+        dt: Datetime to format
+
+    Returns:
+        Formatted timestamp string
+    """
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+
 def extract_connection_id(local_addr: str, remote_addr: str) -> str:
     """Extract connection identifier from local and remote addresses.
 
@@ -409,6 +487,43 @@ def extract_connection_id(local_addr: str, remote_addr: str) -> str:
     return f"{local_addr.strip()},{remote_addr.strip()}"
 
 
+def _iter_canonical_rows(rows: Iterable[List[str]]) -> Iterator[Dict[str, str]]:
+    """Build log entries from rows in the canonical column order.
+
+    Specialized version of the standard-header path in parse_log_csv for
+    logs whose header is exactly _CANONICAL_HEADERS, which is the common case.
+
+    Args:
+        rows: Data rows (without header)
+
+    Yields:
+        Log entry dictionaries with standardized keys
+    """
+    intern = sys.intern
+
+    for row in rows:
+        # Skip empty rows. Data rows start with a non-blank date, so the
+        # check over all fields only runs for rows that might be blank.
+        first = row[0] if row else ""
+        if (not first or first.isspace()) and not "".join(row).strip():
+            continue
+        if len(row) != 7:
+            yield dict(zip(_CANONICAL_HEADERS, row))
+            continue
+        date, time, action, process, protocol, local_addr, remote_addr = row
+        # Dates, actions, processes, protocols and addresses repeat across
+        # many rows, so share one string object per distinct value
+        yield {
+            "Date": intern(date),
+            "Time": time,
+            "Action": intern(action),
+            "Process": intern(process),
+            "Protocol": intern(protocol),
+            "LocalAddr": intern(local_addr),
+            "RemoteAddr": intern(remote_addr),
+        }
+
+
 def parse_log_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str]]:
     """Parse log CSV content into list of log entries.
 
@@ -428,20 +543,70 @@ def parse_log_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str
     Raises:
         ValueError: If CSV format is invalid or too ambiguous
     """
-    content = csv_content.strip()
-    if not content:
-        raise ValueError("CSV content is empty")
+    return list(_iter_log_entries(csv_content, verbose))
 
-    lines = content.splitlines()
 
-    # Try to parse with csv.reader first to get all rows
-    reader_list = list(csv.reader(lines))
-    if not reader_list:
-        raise ValueError("CSV content is empty")
+def parse_log_csv_stream(
+    stream: TextIO, verbose: bool = False
+) -> Iterator[Dict[str, str]]:
+    """Parse log CSV from a text stream, yielding log entries as rows are read.
+
+    Unlike parse_log_csv, the log is never held in memory as a whole when it
+    has standard headers, so arbitrarily large log files can be processed.
+    The stream should be opened with newline="" as recommended for csv.
+
+    Args:
+        stream: Text stream (e.g. an open file) with log CSV content
+        verbose: Whether to print verbose logging messages
+
+    Yields:
+        Log entry dictionaries with the same keys as parse_log_csv
+
+    Raises:
+        ValueError: If CSV format is invalid or too ambiguous
+    """
+    return _iter_log_entries(stream, verbose)
+
+
+def _iter_log_entries(
+    source: Union[str, TextIO], verbose: bool
+) -> Iterator[Dict[str, str]]:
+    """Parse log CSV content, yielding log entries as rows are read.
+
+    Logs with standard headers are streamed row by row; only the first few
+    rows are read ahead to validate the column layout. Logs that need column
+    auto-detection are read in full first, since detection samples all rows.
+
+    Args:
+        source: CSV content with log entries, or a text stream to read it from
+        verbose: Whether to print verbose logging messages
 
-    # First row might be headers or data
-    first_row = reader_list[0]
-    data_rows = reader_list[1:] if len(reader_list) > 1 else []
+    Yields:
+        Log entry dictionaries with standardized keys
+
+    Raises:
+        ValueError: If CSV format is invalid or too ambiguous
+    """
+    if isinstance(source, str):
+        if not source or source.isspace():
+            raise ValueError("CSV content is empty")
+        stream: TextIO = io.StringIO(source)
+    else:
+        stream = source
+
+    # csv.reader consumes the stream lazily and handles both \n and \r\n
+    # line endings. Leading blank or whitespace-only lines are skipped so the
+    # first row is always the header (or first data row).
+    reader = itertools.dropwhile(
+        lambda row: not any(field.strip() for field in row), csv.reader(stream)
+    )
+
+    # First row might be headers or data; a few more rows are read ahead
+    # for header detection and validation
+    first_row = next(reader, None)
+    if first_row is None:
+        raise ValueError("CSV content is empty")
+    data_rows: List[List[str]] = list(itertools.islice(reader, _LOOKAHEAD_ROWS))
 
     # Check if first row looks like headers
     has_headers = False
@@ -466,7 +631,7 @@ def parse_log_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str
     else:
         # First row is data
         log_verbose("No headers detected, will auto-detect columns", verbose)
-        data_rows = reader_list
+        data_rows.insert(0, first_row)
 
     # Check if we have standard headers (all expected columns present)
     standard_headers = False
@@ -505,9 +670,12 @@ def parse_log_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str
                 f"Expected headers: {list(expected_headers)}"
             )
 
-    # Auto-detect columns if needed
+    # Auto-detect columns if needed; detection looks at every row
     column_mapping = None
+    rows: Iterable[List[str]] = itertools.chain(data_rows, reader)
     if not standard_headers:
+        data_rows.extend(reader)
+        rows = data_rows
         log_verbose("Attempting auto-detection of columns", verbose)
         try:
             column_mapping = _auto_detect_headers(data_rows, headers, verbose)
@@ -536,24 +704,23 @@ def parse_log_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str
                 raise
 
     # Parse log entries
-    log_entries = []
-
-    if standard_headers:
-        # Use DictReader with standard headers
-        reader = csv.DictReader(lines)
-        if reader.fieldnames:
-            reader.fieldnames = [
-                name.strip() if name is not None else name for name in reader.fieldnames
-            ]
-            log_verbose(f"Log CSV headers: {reader.fieldnames}", verbose)
-
-        for row in reader:
+    log_entries: Iterator[Dict[str, str]]
+    entry_count = 0
+
+    if standard_headers and headers == _CANONICAL_HEADERS:
+        # Fast path for the canonical column order
+        log_verbose("Canonical log headers detected, using fast path", verbose)
+        log_entries = _iter_canonical_rows(rows)
+    elif standard_headers:
+        # Build entries directly from the parsed rows and headers
+        assert headers is not None
+        log_verbose(f"Log CSV headers: {headers}", verbose)
+        log_entries = (
+            dict(zip(headers, row_data))
+            for row_data in rows
             # Skip empty rows
-            if any(value and value.strip() for value in row.values()):
-                normalized_row = {
-                    key.strip(): value for key, value in row.items() if key is not None
-                }
-                log_entries.append(normalized_row)
+            if any(value and value.strip() for value in row_data)
+        )
     else:
         # Use column mapping
         if column_mapping is None:
@@ -561,27 +728,106 @@ def parse_log_csv(csv_content: str, verbose: bool = False) -> List[Dict[str, str
                 "Column mapping is not available. Cannot parse log entries."
             )
         log_verbose(f"Using column mapping: {column_mapping}", verbose)
+        log_entries = _iter_mapped_rows(rows, column_mapping)
+
+    for entry in log_entries:
+        entry_count += 1
+        yield entry
+
+    log_verbose(f"Parsed {entry_count} log entries from CSV", verbose)
+
+
+def _iter_mapped_rows(
+    rows: Iterable[List[str]], column_mapping: Dict[str, int]
+) -> Iterator[Dict[str, str]]:
+    """Build log entries from rows using auto-detected column positions.
+
+    Args:
+        rows: Data rows (without header)
+        column_mapping: Mapping from standard header names to column indices
+
+    Yields:
+        Log entry dictionaries with standardized keys
+    """
+    for row_data in rows:
+        if not any(value and value.strip() for value in row_data):
+            continue  # Skip empty rows
+
+        # Build standardized row
+        entry = {}
+        for std_name, col_idx in column_mapping.items():
+            if col_idx < len(row_data):
+                entry[std_name] = row_data[col_idx]
+            else:
+                entry[std_name] = ""
+
+        yield entry
 
-        for row_data in data_rows:
-            if not any(value and value.strip() for value in row_data):
-                continue  # Skip empty rows
 
-            # Build standardized row
-            entry = {}
-            for std_name, col_idx in column_mapping.items():
-                if col_idx < len(row_data):
-                    entry[std_name] = row_data[col_idx]
-                else:
-                    entry[std_name] = ""
+class _OpenConnection:
+    """Running summary of the Added and Removed events of one connection.
 
-            log_entries.append(entry)
+    Events are folded in as they are read, so a connection's events never
+    have to be stored or scanned a second time when it completes.
+    """
+
+    __slots__ = (
+        "added_protocol",
+        "removed_protocol",
+        "start",
+        "end",
+        "removed_start",
+        "added_process",
+        "removed_process",
+    )
 
-    log_verbose(f"Parsed {len(log_entries)} log entries from CSV", verbose)
-    return log_entries
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the summary so a reused identifier starts a new connection."""
+        # Protocol of the first Added/Removed event, None until one is seen
+        self.added_protocol: Optional[str] = None
+        self.removed_protocol: Optional[str] = None
+        # Earliest Added, latest Removed and earliest Removed timestamps
+        self.start: Optional[datetime] = None
+        self.end: Optional[datetime] = None
+        self.removed_start: Optional[datetime] = None
+        # Last non-Unknown Added process and first non-Unknown Removed process
+        self.added_process = "Unknown"
+        self.removed_process = "Unknown"
+
+    def add(self, event: Dict[str, str]) -> None:
+        """Fold in an Added event."""
+        if self.added_protocol is None:
+            self.added_protocol = event.get("Protocol", "TCP")
+        dt = parse_log_timestamp(event.get("Date", ""), event.get("Time", ""))
+        if dt:
+            if self.start is None or dt < self.start:
+                self.start = dt
+            # Prefer non-Unknown process names
+            proc = event.get("Process", "Unknown").strip()
+            if proc and proc != "Unknown":
+                self.added_process = proc
+
+    def remove(self, event: Dict[str, str]) -> None:
+        """Fold in a Removed event."""
+        if self.removed_protocol is None:
+            self.removed_protocol = event.get("Protocol", "TCP")
+        dt = parse_log_timestamp(event.get("Date", ""), event.get("Time", ""))
+        if dt:
+            if self.end is None or dt > self.end:
+                self.end = dt
+            if self.removed_start is None or dt < self.removed_start:
+                self.removed_start = dt
+            if self.removed_process == "Unknown":
+                proc = event.get("Process", "Unknown").strip()
+                if proc and proc != "Unknown":
+                    self.removed_process = proc
 
 
 def match_connection_events(
-    log_entries: List[Dict[str, str]], verbose: bool = False
+    log_entries: Iterable[Dict[str, str]], verbose: bool = False
 ) -> List[Dict[str, str]]:
     """Match Added and Removed events for connections.
 
@@ -603,28 +849,25 @@ def match_connection_events(
       end)
 
     Args:
-        log_entries: List of log entry dictionaries
+        log_entries: Log entry dictionaries, in log order; any iterable is
+                     consumed in a single pass
         verbose: Whether to print verbose logging messages
 
     Returns:
         List of matched connection dictionaries with start/end timestamps
     """
-    log_verbose(
-        f"Matching connection events from {len(log_entries)} log entries", verbose
-    )
+    log_verbose("Matching connection events from log entries", verbose)
 
     # Process events in order and detect connection boundaries
     result = []
-    # Track active connections: conn_id -> {added_events, removed_events}
-    active_connections: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+    # Track active connections: (local, remote) -> running summary of events.
+    # Keying by the address pair reuses the strings' cached hashes instead of
+    # building and hashing a combined identifier string for every row.
+    active_connections: Dict[_ConnectionKey, _OpenConnection] = {}
 
     for entry in log_entries:
-        # Extract connection identifier
         local_addr = entry.get("LocalAddr", "")
         remote_addr = entry.get("RemoteAddr", "")
-        conn_id = extract_connection_id(local_addr, remote_addr)
-        action = entry.get("Action", "").strip()
-
         if not local_addr or not remote_addr:
             log_verbose(
                 f"Skipping entry with missing address fields: "
@@ -633,22 +876,20 @@ def match_connection_events(
             )
             continue
 
-        # Initialize connection if not seen before
-        if conn_id not in active_connections:
-            active_connections[conn_id] = {
-                "added_events": [],
-                "removed_events": [],
-            }
+        # Connection identifier, as in extract_connection_id
+        conn_id = (local_addr.strip(), remote_addr.strip())
+        action = entry.get("Action", "").strip()
 
-        conn = active_connections[conn_id]
+        # Initialize connection if not seen before
+        conn = active_connections.get(conn_id)
+        if conn is None:
+            conn = active_connections[conn_id] = _OpenConnection()
 
         # Detect connection reuse: if we see an Added event and we already
         # have Removed events, this is a new connection
-        if action == "Added" and conn["removed_events"]:
+        if action == "Added" and conn.removed_protocol is not None:
             # Complete the previous connection
-            completed_conn = _create_connection_entry(
-                conn_id, conn["added_events"], conn["removed_events"], verbose
-            )
+            completed_conn = _create_connection_entry(conn_id, conn, verbose)
             if completed_conn:
                 result.append(completed_conn)
                 log_verbose(
@@ -656,24 +897,21 @@ def match_connection_events(
                     verbose,
                 )
 
-            # Start a new connection
-            active_connections[conn_id] = {
-                "added_events": [entry],
-                "removed_events": [],
-            }
+            # Start a new connection under the same identifier, reusing the
+            # summary object in place
+            conn.reset()
+            conn.add(entry)
         elif action == "Added":
-            conn["added_events"].append(entry)
+            conn.add(entry)
         elif action == "Removed":
-            conn["removed_events"].append(entry)
+            conn.remove(entry)
 
     # Process remaining active connections
     log_verbose(
         f"Processing {len(active_connections)} remaining active connections", verbose
     )
     for conn_id, conn in active_connections.items():
-        completed_conn = _create_connection_entry(
-            conn_id, conn["added_events"], conn["removed_events"], verbose
-        )
+        completed_conn = _create_connection_entry(conn_id, conn, verbose)
         if completed_conn:
             result.append(completed_conn)
             log_verbose(f"Completed connection: {completed_conn['Name']}", verbose)
@@ -683,52 +921,29 @@ def match_connection_events(
 
 
 def _create_connection_entry(
-    conn_id: str,
-    added_events: List[Dict[str, str]],
-    removed_events: List[Dict[str, str]],
+    conn_id: _ConnectionKey,
+    conn: _OpenConnection,
     verbose: bool = False,
 ) -> Optional[Dict[str, str]]:
-    """Create a connection entry from Added and Removed events.
+    """Create a connection entry from a connection's Added and Removed events.
 
     Args:
-        conn_id: Connection identifier
-        added_events: List of Added events for this connection
-        removed_events: List of Removed events for this connection
+        conn_id: Connection identifier as a (local, remote) address pair
+        conn: Running summary of the connection's events
         verbose: Whether to print verbose logging messages
 
     Returns:
         Dictionary with Name, start_timestamp, end_timestamp or None if no
         valid timestamps
     """
-    # Get timestamps
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
-    process_name = "Unknown"
-
-    # Find earliest Added event for start time
-    if added_events:
-        for event in added_events:
-            dt = parse_log_timestamp(event.get("Date", ""), event.get("Time", ""))
-            if dt:
-                if start_time is None or dt < start_time:
-                    start_time = dt
-                # Prefer non-Unknown process names
-                proc = event.get("Process", "Unknown").strip()
-                if proc and proc != "Unknown":
-                    process_name = proc
-
-    # Find latest Removed event for end time
-    if removed_events:
-        for event in removed_events:
-            dt = parse_log_timestamp(event.get("Date", ""), event.get("Time", ""))
-            if dt:
-                if end_time is None or dt > end_time:
-                    end_time = dt
-                # Prefer non-Unknown process names if we don't have one yet
-                if process_name == "Unknown":
-                    proc = event.get("Process", "Unknown").strip()
-                    if proc and proc != "Unknown":
-                        process_name = proc
+    # Earliest Added event for start time, latest Removed event for end time
+    start_time = conn.start
+    end_time = conn.end
+
+    # Prefer non-Unknown process names from Added events, then Removed events
+    process_name = conn.added_process
+    if process_name == "Unknown":
+        process_name = conn.removed_process
 
     # Handle incomplete connections
     # If we have Added but no Removed (connection ongoing at log end)
@@ -738,56 +953,40 @@ def _create_connection_entry(
 
     # If we have Removed but no Added (connection started before logging)
     if end_time and not start_time:
-        # Find the earliest Removed event for start time
-        for event in removed_events:
-            dt = parse_log_timestamp(event.get("Date", ""), event.get("Time", ""))
-            if dt:
-                if start_time is None or dt < start_time:
-                    start_time = dt
-        # If still no start_time, use end_time
-        if not start_time:
-            start_time = end_time
+        # Use the earliest Removed event for start time
+        start_time = conn.removed_start
 
     # Only include connections with at least one timestamp
     if not (start_time or end_time):
         return None
 
-    # Ensure both timestamps exist
-    if not start_time:
-        start_time = end_time
-    if not end_time:
-        end_time = start_time
-
     # Type narrowing: at this point, both are not None
     assert start_time is not None
     assert end_time is not None
 
     # Get protocol and addresses for the task name
-    protocol = ""
-    if added_events:
-        protocol = added_events[0].get("Protocol", "TCP")
-    elif removed_events:
-        protocol = removed_events[0].get("Protocol", "TCP")
+    protocol = conn.added_protocol
+    if protocol is None:
+        protocol = conn.removed_protocol or ""
 
-    local_addr = conn_id.split(",")[0] if "," in conn_id else ""
-    remote_addr = conn_id.split(",")[1] if "," in conn_id else ""
+    local_addr, remote_addr = conn_id
 
     # Create task name combining process, protocol, and connection info
     task_name = f"{process_name} ({protocol}): {local_addr} -> {remote_addr}"
 
     return {
         "Name": task_name,
-        "start_timestamp": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        "end_timestamp": end_time.strftime("%Y-%m-%d %H:%M:%S"),
+        "start_timestamp": _format_timestamp(start_time),
+        "end_timestamp": _format_timestamp(end_time),
     }
 
 
-def convert_log_to_csv(log_content: str, verbose: bool = False) -> str:
+def convert_log_to_csv(log_content: Union[str, TextIO], verbose: bool = False) -> str:
     """Convert log format to standard CSV format for diagram visualization.
 
     Args:
         log_content: Log CSV content with Date,Time,Action,Process,Protocol,
-                     LocalAddr,RemoteAddr
+                     LocalAddr,RemoteAddr, or a text stream to read it from
         verbose: Whether to print verbose logging messages
 
     Returns:
@@ -796,15 +995,17 @@ def convert_log_to_csv(log_content: str, verbose: bool = False) -> str:
     Raises:
         ValueError: If log format is invalid
     """
-    log_entries = parse_log_csv(log_content, verbose)
+    # Entries are matched as they are parsed, without collecting them first
+    log_entries = _iter_log_entries(log_content, verbose)
     matched_connections = match_connection_events(log_entries, verbose)
 
     # Convert to CSV format
-    lines = ["Name,start_timestamp,end_timestamp"]
-    for conn in matched_connections:
-        name = conn["Name"]
-        start = conn["start_timestamp"]
-        end = conn["end_timestamp"]
-        lines.append(f'"{name}",{start},{end}')
-
-    return "\n".join(lines)
+    header = "Name,start_timestamp,end_timestamp"
+    if not matched_connections:
+        return header
+
+    body = "\n".join(
+        f'"{name}",{start},{end}'
+        for name, start, end in map(_CONNECTION_FIELDS, matched_connections)
+    )
+    return f"{header}\n{body}"
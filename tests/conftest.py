@@ -0,0 +1,16 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+
+import pytest
+
+BASIC_CSV_CONTENT = """task_name,start_date,duration
+Task 1,2024-01-01,3d"""
+
+
+@pytest.fixture(scope="session")
+def basic_csv_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write a basic legacy-format CSV file once per test session."""
+    path: Path = tmp_path_factory.mktemp("data") / "basic.csv"
+    path.write_text(BASIC_CSV_CONTENT, encoding="utf-8")
+    return str(path)
@@ -4,6 +4,7 @@ import codecs
 import os
 import pytest
 import tempfile
+import csv_to_mermaid_gantt
 from csv_to_mermaid_gantt import (
     parse_csv,
     parse_timestamp,
@@ -11,11 +12,15 @@ from csv_to_mermaid_gantt import (
     validate_task,
     format_task_id,
     generate_mermaid_gantt,
+    iter_mermaid_gantt_lines,
     convert_csv_to_mermaid,
     combine_tasks_by_name,
     main,
+    _read_input_file,
+    _run,
 )
 from io import StringIO
+from pathlib import Path
 from unittest.mock import patch
 
 
@@ -85,6 +90,29 @@ Task 2,2024-01-04,2d"""
         assert result[0]["task_name"] == "Task 1"
         assert result[1]["task_name"] == "Task 2"
 
+    def test_parse_csv_with_quoted_empty_row(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a row of quoted empty values is skipped and logged."""
+        csv_content = """task_name,start_date,duration
+Task 1,2024-01-01,3d
+"",""," "
+Task 2,2024-01-04,2d"""
+
+        result = parse_csv(csv_content, verbose=True)
+        assert [task["task_name"] for task in result] == ["Task 1", "Task 2"]
+        assert "Skipping empty row 2" in capsys.readouterr().err
+
+    def test_parse_csv_with_quoted_headers(self) -> None:
+        """Test parsing CSV whose header fields are quoted."""
+        csv_content = """"task_name","start_date",duration
+Task 1,2024-01-01,3d"""
+
+        result = parse_csv(csv_content)
+        assert len(result) == 1
+        assert result[0]["task_name"] == "Task 1"
+        assert result[0]["start_date"] == "2024-01-01"
+
     def test_parse_csv_with_windows_line_endings(self) -> None:
         """Test parsing CSV with Windows line endings (CRLF)."""
         csv_content = (
@@ -98,6 +126,46 @@ Task 2,2024-01-04,2d"""
         assert result[0]["task_name"] == "Task 1"
         assert result[1]["task_name"] == "Task 2"
 
+    @pytest.mark.parametrize("newline", ["\r", "\r\n"], ids=["cr", "crlf"])
+    def test_parse_csv_quoted_with_other_line_endings(self, newline: str) -> None:
+        """Test parsing quoted CSV with CR-only and CRLF line endings."""
+        csv_content = newline.join(
+            ["task_name,start_date", '"Task, 1",2024-01-01', "Task 2,2024-01-02"]
+        )
+
+        result = parse_csv(csv_content)
+        assert [task["task_name"] for task in result] == ["Task, 1", "Task 2"]
+        assert result[1]["start_date"] == "2024-01-02"
+
+    def test_parse_csv_malformed_quoted_field(self) -> None:
+        """Test that a CSV parsing error is reported as a ValueError."""
+        csv_content = 'task_name,start_date\n"' + "x" * 200000 + '",2024-01-01'
+
+        with pytest.raises(ValueError, match="Invalid CSV format"):
+            parse_csv(csv_content)
+
+    @pytest.mark.parametrize(
+        "csv_content",
+        [
+            "task_name,start_date,duration\nTask 1,2024-01-01,3d",
+            "task_name,start_date,duration\nTask 1,2024-01-01,3d\n\n,,\n"
+            "Task 2,2024-01-04,2d",
+            '"task_name",start_date,duration\n"Task, 1",2024-01-01,3d',
+            "Name,start_timestamp,end_timestamp\r\n"
+            "Task 1,2024-01-01T12:00:00,2024-01-01T13:00:00\r\n",
+        ],
+        ids=["basic", "empty_rows", "quoted", "timestamps_crlf"],
+    )
+    def test_parse_csv_cisv_matches_stdlib(self, csv_content: str) -> None:
+        """Test that the optional cisv parser gives the same tasks as stdlib."""
+        cisv = pytest.importorskip("cisv")
+
+        with patch("csv_to_mermaid_gantt._cisv", None):
+            expected = parse_csv(csv_content)
+        with patch("csv_to_mermaid_gantt._cisv", cisv):
+            result = parse_csv(csv_content)
+        assert result == expected
+
 
 class TestParseTimestamp:
     """Tests for parse_timestamp function."""
@@ -127,6 +195,10 @@ class TestParseTimestamp:
         assert dt is not None
         assert dt.microsecond == 123456
 
+    def test_parse_iso8601_with_offset_not_supported(self) -> None:
+        """Test that ISO 8601 with a UTC offset is rejected."""
+        assert parse_timestamp("2024-01-01T12:30:45+02:00") is None
+
     def test_parse_iso8601_space_separator(self) -> None:
         """Test parsing ISO 8601 with space separator."""
         dt = parse_timestamp("2024-01-01 12:30:45")
@@ -149,6 +221,35 @@ class TestParseTimestamp:
         """Test parsing invalid format."""
         assert parse_timestamp("invalid") is None
 
+    @pytest.mark.parametrize(
+        "timestamp_str",
+        [
+            "2024-01-01T10:00",
+            "2024-01-01 12:30:45Z",
+            "2024-W01-1",
+            "20240101T103000",
+            "2024-01-01T12:30:45,123",
+        ],
+    )
+    def test_parse_unsupported_iso8601_shapes(self, timestamp_str: str) -> None:
+        """Test that only the supported ISO 8601 shapes are accepted."""
+        assert parse_timestamp(timestamp_str) is None
+
+    def test_parse_out_of_range_unix_timestamp(self) -> None:
+        """Test parsing an integer Unix timestamp beyond the supported years."""
+        assert parse_timestamp("1000000000000") is None
+
+    def test_parse_invalid_date_only(self) -> None:
+        """Test parsing a date-only string that is not a real date."""
+        assert parse_timestamp("2024-02-30") is None
+
+    def test_parse_fractional_unix_timestamp(self) -> None:
+        """Test parsing Unix timestamp with fractional seconds."""
+        dt = parse_timestamp("1704110400.5")
+        assert dt is not None
+        assert dt.replace(microsecond=0) == parse_timestamp("1704110400")
+        assert dt.microsecond == 500000
+
 
 class TestNormalizeTaskDict:
     """Tests for normalize_task_dict function."""
@@ -221,6 +322,70 @@ Planning,2024-01-01,5d"""
         assert result[0]["start_date"] == "2024-01-01"
         assert result[0]["duration"] == "5d"
 
+    def test_parse_csv_mixed_timestamp_formats(self) -> None:
+        """Test rows whose timestamp format differs from the first row."""
+        csv_content = """Name,start_timestamp,end_timestamp
+Task 1,1704110400,1704110460
+Task 2,2024-01-02T10:00:00Z,2024-01-02 11:00:00
+Task 3,2024-01-03,1704283200"""
+
+        result = parse_csv(csv_content)
+        assert len(result) == 3
+        assert result[1]["start_date"] == "2024-01-02"
+        assert result[1]["start_time"] == "10:00:00"
+        assert result[1]["end_time"] == "11:00:00"
+        assert result[2]["start_date"] == "2024-01-03"
+        assert "end_date" in result[2]
+
+    def test_parse_csv_unix_timestamps_after_iso_row(self) -> None:
+        """Test that Unix timestamps after an ISO row are not read as dates."""
+        csv_content = """Name,start_timestamp
+Task 1,2024-01-01T10:00:00
+Task 2,20240101
+Task 3,1704110400.5"""
+
+        result = parse_csv(csv_content)
+        for task, value in zip(result[1:], ["20240101", "1704110400.5"]):
+            expected = parse_timestamp(value)
+            assert expected is not None
+            assert task["start_date"] == expected.strftime("%Y-%m-%d")
+            assert task["start_time"] == expected.strftime("%H:%M:%S")
+
+    def test_parse_csv_unsupported_iso_shape_after_iso_row(self) -> None:
+        """Test that an ISO row does not widen the accepted timestamp shapes."""
+        csv_content = """Name,start_timestamp
+Task 1,2024-01-01T10:00:00
+Task 2,2024-01-01T10:00
+Task 3,2024-01-01T10:00:00Z
+Task 4,2024-02-30T10:00:00"""
+
+        result = parse_csv(csv_content)
+        assert "start_date" not in result[1]
+        assert result[2]["start_time"] == "10:00:00"
+        assert "start_date" not in result[3]
+
+    def test_parse_csv_out_of_range_timestamp_after_unix_row(self) -> None:
+        """Test an out-of-range Unix timestamp after a Unix timestamp row."""
+        csv_content = """Name,start_timestamp
+Task 1,1704110400
+Task 2,1000000000000"""
+
+        result = parse_csv(csv_content)
+        assert len(result) == 2
+        assert "start_date" in result[0]
+        assert "start_date" not in result[1]
+
+    def test_parse_csv_fractional_unix_timestamps(self) -> None:
+        """Test timestamps in a format without a specialized parser."""
+        csv_content = """Name,start_timestamp,end_timestamp
+Task 1,1704110400.5,1704110460.5"""
+
+        result = parse_csv(csv_content)
+        expected = parse_timestamp("1704110400.5")
+        assert expected is not None
+        assert result[0]["start_date"] == expected.strftime("%Y-%m-%d")
+        assert result[0]["start_time"] == expected.strftime("%H:%M:%S")
+
 
 class TestValidateTask:
     """Tests for validate_task function."""
@@ -575,6 +740,32 @@ class TestGenerateMermaidGantt:
         assert "dateFormat YYYY-MM-DD" in result
         assert "Task 1 :task_1, 2024-01-01, 3d" in result
 
+    def test_iter_lines_matches_generated_chart(self) -> None:
+        """Test that the line generator yields the lines of the full chart."""
+        tasks = [
+            {"task_name": "Task 1", "start_date": "2024-01-01", "duration": "3d"},
+            {"task_name": "Task 2", "start_date": "2024-01-04", "status": "done"},
+        ]
+        lines = list(iter_mermaid_gantt_lines(tasks, "My Project", 1200))
+
+        assert lines[1:4] == [
+            "gantt",
+            "    title My Project",
+            "    dateFormat YYYY-MM-DD",
+        ]
+        assert "\n".join(lines) == generate_mermaid_gantt(tasks, "My Project", 1200)
+
+    def test_iter_lines_rejects_invalid_task_before_first_line(self) -> None:
+        """Test that a later invalid task fails before any line is yielded."""
+        tasks = [
+            {"task_name": "Task 1", "start_date": "2024-01-01", "duration": "3d"},
+            {"task_name": " ", "start_date": "2024-01-04"},
+        ]
+        lines = iter_mermaid_gantt_lines(tasks)
+
+        with pytest.raises(ValueError, match="Missing required field"):
+            next(lines)
+
     def test_generate_custom_title(self) -> None:
         """Test generating Gantt chart with custom title."""
         tasks = [{"task_name": "Task 1"}]
@@ -648,6 +839,20 @@ class TestGenerateMermaidGantt:
 
         assert "Task 1 :task_1, crit, 2024-01-01, 3d" in result
 
+    def test_generate_with_milestone_status(self) -> None:
+        """Test generating Gantt chart with milestone status."""
+        tasks = [
+            {
+                "task_name": "Release",
+                "start_date": "2024-01-10",
+                "duration": "0d",
+                "status": "Milestone",
+            }
+        ]
+        result = generate_mermaid_gantt(tasks)
+
+        assert "Release :release, milestone, 2024-01-10, 0d" in result
+
     def test_generate_with_invalid_status(self) -> None:
         """Test generating Gantt chart with invalid status (should ignore)."""
         tasks = [
@@ -776,75 +981,38 @@ Task 1,2025-12-12 07:59:00,2025-12-12 08:00:21,5d"""
         assert "2025-12-12 08:00:21" in result
         assert "5d" not in result
 
-    def test_convert_issue_csv_with_name_header(self) -> None:
-        """Test converting CSV from issue with Name header and extra column.
-
-        This test covers the exact scenario from the reported issue where the CSV
-        has 'Name' as the header (not 'task_name') and includes an extra column
-        (0:01:21) that doesn't have a corresponding header.
-
-        Note: This is intentionally malformed CSV (4 comma-separated values in the
-        data row, but only 3 headers). The fourth comma-separated value (0:01:21)
-        appears after the third column. Python's csv.DictReader handles this by
-        creating a None key for extra values, which we gracefully ignore (see the
-        None key filtering in validate_task function at line 171).
-        """
-        csv_content = """Name,start_timestamp,end_timestamp
-updTcpIpConnectState,2025-12-12 07:59:00,2025-12-12 08:00:21,0:01:21"""
-
-        result = convert_csv_to_mermaid(csv_content)
-        assert "gantt" in result
-        assert "dateFormat YYYY-MM-DD HH:mm:ss" in result
-        assert "updTcpIpConnectState" in result
-        assert "2025-12-12 07:59:00" in result
-        assert "2025-12-12 08:00:21" in result
-
-    def test_convert_issue_csv_with_task_name_header(self) -> None:
-        """Test converting CSV from issue with task_name header and extra column.
-
-        This test covers the second scenario from the reported issue where the CSV
-        uses 'task_name' as the header and includes an extra column (0:01:21).
-
-        Note: This is intentionally malformed CSV (4 comma-separated values in the
-        data row, but only 3 headers). The fourth comma-separated value (0:01:21)
-        appears after the third column. Python's csv.DictReader handles this by
-        creating a None key for extra values, which we gracefully ignore (see the
-        None key filtering in validate_task function at line 171).
-        """
-        csv_content = """task_name,start_timestamp,end_timestamp
-updTcpIpConnectState,2025-12-12 07:59:00,2025-12-12 08:00:21,0:01:21"""
-
-        result = convert_csv_to_mermaid(csv_content)
-        assert "gantt" in result
-        assert "dateFormat YYYY-MM-DD HH:mm:ss" in result
-        assert "updTcpIpConnectState" in result
-        assert "2025-12-12 07:59:00" in result
-        assert "2025-12-12 08:00:21" in result
-
-    def test_convert_issue_csv_without_extra_column_name_header(self) -> None:
-        """Test converting CSV with Name header and no extra column.
-
-        This test ensures that the basic case with just Name, start_timestamp,
-        and end_timestamp (3 columns total) works correctly.
-        """
-        csv_content = """Name,start_timestamp,end_timestamp
-updTcpIpConnectState,2025-12-12 07:59:00,2025-12-12 08:00:21"""
-
-        result = convert_csv_to_mermaid(csv_content)
-        assert "gantt" in result
-        assert "dateFormat YYYY-MM-DD HH:mm:ss" in result
-        assert "updTcpIpConnectState" in result
-        assert "2025-12-12 07:59:00" in result
-        assert "2025-12-12 08:00:21" in result
+    @pytest.mark.parametrize(
+        "header_name,extra_column",
+        [
+            ("Name", ",0:01:21"),
+            ("task_name", ",0:01:21"),
+            ("Name", ""),
+            ("task_name", ""),
+        ],
+        ids=[
+            "Name_header_extra_column",
+            "task_name_header_extra_column",
+            "Name_header",
+            "task_name_header",
+        ],
+    )
+    def test_convert_issue_csv(self, header_name: str, extra_column: str) -> None:
+        """Test converting CSV from the reported issue.
 
-    def test_convert_issue_csv_without_extra_column_task_name_header(self) -> None:
-        """Test converting CSV with task_name header and no extra column.
+        This covers the scenarios from the reported issue where the CSV uses
+        either 'Name' or 'task_name' as the header, with and without an extra
+        column (0:01:21) that doesn't have a corresponding header.
 
-        This test ensures that the basic case with task_name, start_timestamp,
-        and end_timestamp (3 columns total) works correctly.
+        Note: With the extra column this is intentionally malformed CSV (4
+        comma-separated values in the data row, but only 3 headers).
+        parse_csv drops values that have no corresponding header, so the extra
+        column is gracefully ignored.
         """
-        csv_content = """task_name,start_timestamp,end_timestamp
-updTcpIpConnectState,2025-12-12 07:59:00,2025-12-12 08:00:21"""
+        csv_content = (
+            f"{header_name},start_timestamp,end_timestamp\n"
+            f"updTcpIpConnectState,2025-12-12 07:59:00,2025-12-12 08:00:21"
+            f"{extra_column}"
+        )
 
         result = convert_csv_to_mermaid(csv_content)
         assert "gantt" in result
@@ -864,6 +1032,25 @@ Task 1,2024-01-01,3d"""
         assert "gantt" in result
         assert "Task 1" in result
 
+    def test_convert_with_invalid_width_checked_before_parsing(self) -> None:
+        """Test that an invalid width is rejected before the CSV is parsed."""
+        with pytest.raises(
+            ValueError, match="Width must be an integer between 100 and 10000 pixels"
+        ):
+            convert_csv_to_mermaid("", width=50)
+
+    def test_convert_validates_width_once(self) -> None:
+        """Test that the width is validated once per conversion."""
+        csv_content = """task_name,start_date,duration
+Task 1,2024-01-01,3d"""
+
+        with patch(
+            "csv_to_mermaid_gantt._validate_width",
+            wraps=csv_to_mermaid_gantt._validate_width,
+        ) as mock_validate:
+            convert_csv_to_mermaid(csv_content, width=1500)
+        mock_validate.assert_called_once_with(1500)
+
     def test_convert_with_combine_threshold(self) -> None:
         """Test converting CSV with task combining enabled."""
         csv_content = """Name,start_timestamp,end_timestamp
@@ -911,107 +1098,156 @@ Task1,2024-01-01 10:00:30,2024-01-01 10:01:00"""
 class TestMain:
     """Tests for main CLI function."""
 
-    def test_main_with_input_file(self) -> None:
+    def test_main_with_input_file(self, basic_csv_file: str) -> None:
         """Test main function with input file."""
-        csv_content = """task_name,start_date,duration
-Task 1,2024-01-01,3d"""
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
+        with patch("sys.argv", ["csv_to_mermaid_gantt", basic_csv_file]):
+            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                main()
+                output = mock_stdout.getvalue()
+                assert "gantt" in output
+                assert "Task 1" in output
+
+    def test_main_with_large_output_file(self, tmp_path: Path) -> None:
+        """Test main function writes every task of a large chart to a file."""
+        rows = [f"Task {i},2024-01-01,2024-01-02" for i in range(10000)]
+        csv_content = "task_name,start_date,end_date\n" + "\n".join(rows)
+        output_file = tmp_path / "output.md"
+
+        argv = ["-o", str(output_file)]
+        assert _run(argv, StringIO(csv_content), StringIO(), StringIO()) == 0
+
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert lines[:3] == [
+            "gantt",
+            "    title Gantt Chart",
+            "    dateFormat YYYY-MM-DD",
+        ]
+        assert len(lines) == 3 + 10000
+        assert lines[-1] == "    Task 9999 :task_9999, 2024-01-01, 2024-01-02"
+
+    def test_main_with_large_input_file(self, tmp_path: Path) -> None:
+        """Test main function with a memory-mapped input file over 1MB."""
+        rows = [
+            f"Task {i},2024-01-01 10:00:00,2024-01-01 11:00:00,done"
+            for i in range(25000)
+        ]
+        content = "task_name,start_timestamp,end_timestamp,status\n" + "\n".join(rows)
+        input_file = tmp_path / "large.csv"
+        input_file.write_text(content, encoding="utf-8")
+        assert input_file.stat().st_size > 1 << 20
+
+        stdout = StringIO()
+        assert _run([str(input_file)], StringIO(), stdout, StringIO()) == 0
+        output = stdout.getvalue()
+        assert "Task 0 :task_0, done" in output
+        assert "Task 24999 :task_24999, done" in output
+
+    def test_main_with_empty_input_file(self, tmp_path: Path) -> None:
+        """Test main function with an empty input file."""
+        input_file = tmp_path / "empty.csv"
+        input_file.write_bytes(b"")
+
+        stderr = StringIO()
+        assert _run([str(input_file)], StringIO(), StringIO(), stderr) == 1
+        assert "Error: CSV content is empty" in stderr.getvalue()
+
+    @pytest.mark.parametrize("newline", ["\r", "\r\n"], ids=["cr", "crlf"])
+    def test_main_with_input_file_line_endings(
+        self, tmp_path: Path, newline: str
+    ) -> None:
+        """Test main function with CR-only and CRLF files with quoted fields."""
+        input_file = tmp_path / "input.csv"
+        input_file.write_bytes(
+            newline.join(
+                [
+                    "task_name,start_date,end_date",
+                    '"Task, 1",2024-01-01,2024-01-03',
+                    '"Multi',
+                    'line",2024-01-04,2024-01-05',
+                ]
+            ).encode("utf-8")
+        )
 
+        stdout = StringIO()
+        exit_code = _run([str(input_file)], StringIO(), stdout, StringIO())
+        assert exit_code == 0
+        assert "\r" not in stdout.getvalue()
+        assert "    Task, 1 :task,_1, 2024-01-01, 2024-01-03" in stdout.getvalue()
+        with open(input_file, encoding="utf-8-sig") as f:
+            text = f.read()
+        assert _read_input_file(str(input_file)) == text
+        assert stdout.getvalue() == f"{convert_csv_to_mermaid(text)}\n"
+
+    @pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="requires /dev/fd")
+    def test_main_with_pipe_input_file(self) -> None:
+        """Test main function reading from a pipe, as with <(...) substitution."""
+        read_fd, write_fd = os.pipe()
         try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file]):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "gantt" in output
-                    assert "Task 1" in output
+            os.write(
+                write_fd, codecs.BOM_UTF8 + b"task_name,start_date\nTask A,2024-01-01\n"
+            )
+            os.close(write_fd)
+            stdout = StringIO()
+            exit_code = _run([f"/dev/fd/{read_fd}"], StringIO(), stdout, StringIO())
         finally:
-            os.unlink(temp_file)
+            os.close(read_fd)
 
-    def test_main_with_output_file(self) -> None:
-        """Test main function with output file."""
-        csv_content = """task_name,start_date,duration
-Task 1,2024-01-01,3d"""
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            input_file = f.name
+        assert exit_code == 0
+        assert "    Task A :task_a, 2024-01-01" in stdout.getvalue()
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".md") as f:
-            output_file = f.name
+    def test_main_with_output_file(self, basic_csv_file: str, tmp_path: Path) -> None:
+        """Test main function with output file."""
+        output_file = str(tmp_path / "output.md")
 
-        try:
-            with patch(
-                "sys.argv", ["csv_to_mermaid_gantt", input_file, "-o", output_file]
-            ):
-                main()
+        with patch(
+            "sys.argv", ["csv_to_mermaid_gantt", basic_csv_file, "-o", output_file]
+        ):
+            main()
 
-                with open(output_file, "r") as f:
-                    output = f.read()
-                    assert "gantt" in output
-                    assert "Task 1" in output
-        finally:
-            os.unlink(input_file)
-            os.unlink(output_file)
+            with open(output_file, "r") as f:
+                output = f.read()
+                assert "gantt" in output
+                assert "Task 1" in output
 
     def test_main_with_stdin(self) -> None:
         """Test main function with stdin input."""
         csv_content = """task_name,start_date,duration
 Task 1,2024-01-01,3d"""
 
-        with patch("sys.argv", ["csv_to_mermaid_gantt"]):
-            with patch("sys.stdin", StringIO(csv_content)):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "gantt" in output
-                    assert "Task 1" in output
+        stdout = StringIO()
+        exit_code = _run([], StringIO(csv_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "gantt" in output
+        assert "Task 1" in output
 
     def test_main_with_verbose_flag(self) -> None:
         """Test main function with verbose flag."""
         csv_content = """Name,start_timestamp,end_timestamp
 Task 1,2024-01-01T12:00:00,2024-01-01T13:00:00"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file, "--verbose"]):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-                        main()
-                        output = mock_stdout.getvalue()
-                        stderr = mock_stderr.getvalue()
-                        assert "gantt" in output
-                        assert "Task 1" in output
-                        # Check for verbose output in stderr
-                        assert "[DEBUG]" in stderr
-                        assert "CSV headers detected" in stderr
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        stderr = StringIO()
+        exit_code = _run(["--verbose"], StringIO(csv_content), stdout, stderr)
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "gantt" in output
+        assert "Task 1" in output
+        # Check for verbose output in stderr
+        assert "[DEBUG]" in stderr.getvalue()
+        assert "CSV headers detected" in stderr.getvalue()
 
     def test_main_with_custom_title(self) -> None:
         """Test main function with custom title."""
         csv_content = """task_name,start_date,duration
 Task 1,2024-01-01,3d"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch(
-                "sys.argv", ["csv_to_mermaid_gantt", temp_file, "-t", "My Project"]
-            ):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "title My Project" in output
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(
+            ["-t", "My Project"], StringIO(csv_content), stdout, StringIO()
+        )
+        assert exit_code == 0
+        assert "title My Project" in stdout.getvalue()
 
     def test_main_file_not_found(self) -> None:
         """Test main function with non-existent file."""
@@ -1022,8 +1258,41 @@ Task 1,2024-01-01,3d"""
                 assert exc_info.value.code == 1
                 assert "File not found" in mock_stderr.getvalue()
 
+    def test_main_html_file_not_found(self) -> None:
+        """Test HTML mode reports the first missing input file."""
+        stderr = StringIO()
+        exit_code = _run(
+            ["--html", "nonexistent1.csv", "nonexistent2.csv"],
+            StringIO(),
+            StringIO(),
+            stderr,
+        )
+        assert exit_code == 1
+        assert "File not found" in stderr.getvalue()
+        assert "nonexistent1.csv" in stderr.getvalue()
+
     def test_main_invalid_csv(self) -> None:
         """Test main function with invalid CSV."""
+        stderr = StringIO()
+        exit_code = _run([], StringIO(""), StringIO(), stderr)
+        assert exit_code == 1
+        assert "Error:" in stderr.getvalue()
+
+    def test_main_invalid_task_writes_no_output(self) -> None:
+        """Test that an invalid later task leaves stdout empty."""
+        csv_content = """task_name,start_date,duration
+Task 1,2024-01-01,3d
+ ,2024-01-04,2d"""
+
+        stdout = StringIO()
+        stderr = StringIO()
+        exit_code = _run([], StringIO(csv_content), stdout, stderr)
+        assert exit_code == 1
+        assert stdout.getvalue() == ""
+        assert "Missing required field" in stderr.getvalue()
+
+    def test_main_exits_with_error_code(self) -> None:
+        """Test that main exits with the error code returned by _run."""
         with patch("sys.argv", ["csv_to_mermaid_gantt"]):
             with patch("sys.stdin", StringIO("")):
                 with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
@@ -1037,23 +1306,14 @@ Task 1,2024-01-01,3d"""
         csv_content = """task_name,start_date,duration
 Task 1,2024-01-01,3d"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file]):
-                with patch(
-                    "csv_to_mermaid_gantt.convert_csv_to_mermaid",
-                    side_effect=RuntimeError("Test error"),
-                ):
-                    with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-                        with pytest.raises(SystemExit) as exc_info:
-                            main()
-                        assert exc_info.value.code == 1
-                        assert "Unexpected error" in mock_stderr.getvalue()
-        finally:
-            os.unlink(temp_file)
+        stderr = StringIO()
+        with patch(
+            "csv_to_mermaid_gantt.parse_csv",
+            side_effect=RuntimeError("Test error"),
+        ):
+            exit_code = _run([], StringIO(csv_content), StringIO(), stderr)
+        assert exit_code == 1
+        assert "Unexpected error" in stderr.getvalue()
 
     @pytest.mark.parametrize(
         "header_name",
@@ -1083,49 +1343,41 @@ updTcpIpConnectState,2025-12-12 07:59:00,2025-12-12 08:00:21"""
         finally:
             os.unlink(temp_file)
 
+    def test_main_with_utf8_bom_on_stdin(self) -> None:
+        """Test main function with UTF-8 BOM at the start of stdin."""
+        csv_content = """\ufeffName,start_timestamp,end_timestamp
+updTcpIpConnectState,2025-12-12 07:59:00,2025-12-12 08:00:21"""
+
+        stdout = StringIO()
+        exit_code = _run([], StringIO(csv_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "updTcpIpConnectState" in output
+        assert "2025-12-12 07:59:00" in output
+
     def test_main_with_width_flag(self) -> None:
         """Test main function with width flag."""
         csv_content = """task_name,start_date,duration
 Task 1,2024-01-01,3d"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file, "-w", "2000"]):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "%%{init:" in output
-                    assert "'gantt': {'useWidth': 2000}" in output
-                    assert "gantt" in output
-                    assert "Task 1" in output
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(["-w", "2000"], StringIO(csv_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "%%{init:" in output
+        assert "'gantt': {'useWidth': 2000}" in output
+        assert "gantt" in output
+        assert "Task 1" in output
 
     def test_main_with_invalid_width(self) -> None:
         """Test main function with invalid width value."""
         csv_content = """task_name,start_date,duration
 Task 1,2024-01-01,3d"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file, "-w", "50"]):
-                with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
-                    with pytest.raises(SystemExit) as exc_info:
-                        main()
-                    assert exc_info.value.code == 1
-                    stderr_output = mock_stderr.getvalue()
-                    assert (
-                        "Width must be an integer between 100 and 10000"
-                        in stderr_output
-                    )
-        finally:
-            os.unlink(temp_file)
+        stderr = StringIO()
+        exit_code = _run(["-w", "50"], StringIO(csv_content), StringIO(), stderr)
+        assert exit_code == 1
+        assert "Width must be an integer between 100 and 10000" in stderr.getvalue()
 
     def test_main_with_combine_threshold_flag(self) -> None:
         """Test main function with combine threshold flag."""
@@ -1133,23 +1385,16 @@ Task 1,2024-01-01,3d"""
 Task1,2024-01-01 10:00:00,2024-01-01 10:00:30
 Task1,2024-01-01 10:01:20,2024-01-01 10:02:00"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file, "-c", "60"]):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "gantt" in output
-                    assert "Task1" in output
-                    # Should be combined
-                    lines = output.split("\n")
-                    task_lines = [line for line in lines if "Task1" in line]
-                    assert len(task_lines) == 1
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(["-c", "60"], StringIO(csv_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "gantt" in output
+        assert "Task1" in output
+        # Should be combined
+        lines = output.split("\n")
+        task_lines = [line for line in lines if "Task1" in line]
+        assert len(task_lines) == 1
 
     def test_main_with_combine_threshold_disabled(self) -> None:
         """Test main function with combine threshold set to 0 (disabled)."""
@@ -1157,26 +1402,18 @@ Task1,2024-01-01 10:01:20,2024-01-01 10:02:00"""
 Task1,2024-01-01 10:00:00,2024-01-01 10:00:30
 Task1,2024-01-01 10:01:20,2024-01-01 10:02:00"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch(
-                "sys.argv",
-                ["csv_to_mermaid_gantt", temp_file, "--combine-threshold", "0"],
-            ):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "gantt" in output
-                    assert "Task1" in output
-                    # Should not be combined (0 disables the feature)
-                    lines = output.split("\n")
-                    task_lines = [line for line in lines if "Task1" in line]
-                    assert len(task_lines) == 2
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(
+            ["--combine-threshold", "0"], StringIO(csv_content), stdout, StringIO()
+        )
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "gantt" in output
+        assert "Task1" in output
+        # Should not be combined (0 disables the feature)
+        lines = output.split("\n")
+        task_lines = [line for line in lines if "Task1" in line]
+        assert len(task_lines) == 2
 
     def test_main_with_default_combine_threshold(self) -> None:
         """Test main function with default combine threshold (60 seconds)."""
@@ -1184,23 +1421,16 @@ Task1,2024-01-01 10:01:20,2024-01-01 10:02:00"""
 Task1,2024-01-01 10:00:00,2024-01-01 10:00:30
 Task1,2024-01-01 10:01:20,2024-01-01 10:02:00"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file]):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "gantt" in output
-                    assert "Task1" in output
-                    # Should be combined with default 60s threshold
-                    lines = output.split("\n")
-                    task_lines = [line for line in lines if "Task1" in line]
-                    assert len(task_lines) == 1
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run([], StringIO(csv_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "gantt" in output
+        assert "Task1" in output
+        # Should be combined with default 60s threshold
+        lines = output.split("\n")
+        task_lines = [line for line in lines if "Task1" in line]
+        assert len(task_lines) == 1
 
     def test_main_html_output_single_file(self) -> None:
         """Test main function with HTML output mode for single file."""
@@ -1261,44 +1491,27 @@ Task2,2024-01-01T12:00:00,2024-01-01T13:00:00"""
         csv_content = """Name,start_timestamp,end_timestamp
 Task1,2024-01-01T10:00:00,2024-01-01T11:00:00"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch(
-                "sys.argv",
-                ["csv_to_mermaid_gantt", temp_file, "--html", "-t", "Custom Title"],
-            ):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "Custom Title" in output
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(
+            ["--html", "-t", "Custom Title"], StringIO(csv_content), stdout, StringIO()
+        )
+        assert exit_code == 0
+        assert "Custom Title" in stdout.getvalue()
 
     def test_main_html_output_selective_charts(self) -> None:
         """Test main function with HTML output and selective charts."""
         csv_content = """Name,start_timestamp,end_timestamp
 Task1,2024-01-01T10:00:00,2024-01-01T11:00:00"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(csv_content)
-            temp_file = f.name
-
-        try:
-            with patch(
-                "sys.argv",
-                ["csv_to_mermaid_gantt", temp_file, "--html", "--no-histogram"],
-            ):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "Timeline Chart" in output
-                    assert "Event Histogram" not in output
-                    assert "Line Graph" in output
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(
+            ["--html", "--no-histogram"], StringIO(csv_content), stdout, StringIO()
+        )
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "Timeline Chart" in output
+        assert "Event Histogram" not in output
+        assert "Line Graph" in output
 
     def test_main_html_output_to_file(self) -> None:
         """Test main function with HTML output to file."""
@@ -1335,13 +1548,12 @@ Task1,2024-01-01T10:00:00,2024-01-01T11:00:00"""
         csv_content = """Name,start_timestamp,end_timestamp
 Task1,2024-01-01T10:00:00,2024-01-01T11:00:00"""
 
-        with patch("sys.argv", ["csv_to_mermaid_gantt", "--html"]):
-            with patch("sys.stdin", StringIO(csv_content)):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "<!DOCTYPE html>" in output
-                    assert "stdin" in output
+        stdout = StringIO()
+        exit_code = _run(["--html"], StringIO(csv_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "<!DOCTYPE html>" in output
+        assert "stdin" in output
 
     def test_main_with_log_format_flag(self) -> None:
         """Test main function with log format flag."""
@@ -1351,21 +1563,14 @@ Task1,2024-01-01T10:00:00,2024-01-01T11:00:00"""
 18/12/2025,13.00.56,Removed,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443
 18/12/2025,13.02.55,Removed,Unknown,TCP,10.10.0.1:58100,123.123.123.123:443"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(log_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file, "--log-format"]):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "gantt" in output
-                    assert "processName.exe" in output
-                    assert "2025-12-18 13:00:54" in output
-                    assert "2025-12-18 13:02:55" in output
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(["--log-format"], StringIO(log_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "gantt" in output
+        assert "processName.exe" in output
+        assert "2025-12-18 13:00:54" in output
+        assert "2025-12-18 13:02:55" in output
 
     def test_main_with_log_format_and_html(self) -> None:
         """Test main function with log format flag and HTML output."""
@@ -1373,22 +1578,14 @@ Task1,2024-01-01T10:00:00,2024-01-01T11:00:00"""
 18/12/2025,13.00.54,Added,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443
 18/12/2025,13.00.56,Removed,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(log_content)
-            temp_file = f.name
-
-        try:
-            with patch(
-                "sys.argv",
-                ["csv_to_mermaid_gantt", temp_file, "--log-format", "--html"],
-            ):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "<!DOCTYPE html>" in output
-                    assert "processName.exe" in output
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(
+            ["--log-format", "--html"], StringIO(log_content), stdout, StringIO()
+        )
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "<!DOCTYPE html>" in output
+        assert "processName.exe" in output
 
     def test_main_with_log_format_incomplete_data(self) -> None:
         """Test main function with log format flag and incomplete data."""
@@ -1398,18 +1595,11 @@ Task1,2024-01-01T10:00:00,2024-01-01T11:00:00"""
 18/12/2025,13.10.00,Added,anotherProcess.exe,TCP,10.10.0.1:58101,123.123.123.123:443
 18/12/2025,13.10.02,Added,Unknown,TCP,10.10.0.1:58101,123.123.123.123:443"""
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
-            f.write(log_content)
-            temp_file = f.name
-
-        try:
-            with patch("sys.argv", ["csv_to_mermaid_gantt", temp_file, "--log-format"]):
-                with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-                    main()
-                    output = mock_stdout.getvalue()
-                    assert "gantt" in output
-                    # Should handle incomplete data gracefully
-                    assert "processName.exe" in output
-                    assert "anotherProcess.exe" in output
-        finally:
-            os.unlink(temp_file)
+        stdout = StringIO()
+        exit_code = _run(["--log-format"], StringIO(log_content), stdout, StringIO())
+        assert exit_code == 0
+        output = stdout.getvalue()
+        assert "gantt" in output
+        # Should handle incomplete data gracefully
+        assert "processName.exe" in output
+        assert "anotherProcess.exe" in output
@@ -1,6 +1,10 @@
 """Tests for HTML Visualization module."""
 
+import json
+import pytest
+from unittest.mock import Mock, patch
 from csv_to_mermaid_gantt.html_visualizations import (
+    _dumps_json,
     prepare_timeline_data,
     prepare_histogram_data,
     prepare_line_graph_data,
@@ -142,10 +146,42 @@ class TestPrepareHistogramData:
         # Both tasks should be in the same 60-second bin
         assert result["counts"][0] == 2
 
+    def test_prepare_histogram_data_skips_long_gaps(self) -> None:
+        """Test that only the first empty bin after a bin with data is kept."""
+        tasks = [
+            {"task_name": "A", "start_date": "2024-01-01", "start_time": "10:00:00"},
+            {"task_name": "B", "start_date": "2024-01-01", "start_time": "10:30:00"},
+            {"task_name": "C", "start_date": "2024-01-01", "start_time": "14:15:00"},
+        ]
+
+        result = prepare_histogram_data(tasks, bin_size_seconds=3600)
+        assert result["bins"] == [
+            "2024-01-01T10:00:00",
+            "2024-01-01T11:00:00",
+            "2024-01-01T14:00:00",
+        ]
+        assert result["counts"] == [2, 0, 1]
+
 
 class TestPrepareLineGraphData:
     """Tests for prepare_line_graph_data function."""
 
+    def test_prepare_line_graph_data_skips_unparsable_start(self) -> None:
+        """Test that tasks whose start time does not parse are skipped."""
+        tasks = [
+            {"task_name": "Task 1", "start_date": "not a date", "duration": "5d"},
+            {
+                "task_name": "Task 2",
+                "start_date": "2024-01-02",
+                "start_time": "10:00:00",
+                "duration": "3d",
+            },
+        ]
+
+        result = prepare_line_graph_data(tasks, value_field="duration")
+        assert result["timestamps"] == ["2024-01-02T10:00:00"]
+        assert result["values"] == [72.0]
+
     def test_prepare_line_graph_data_basic(self) -> None:
         """Test preparing line graph data from tasks with duration."""
         tasks = [
@@ -349,6 +385,73 @@ class TestGenerateHtmlVisualization:
         assert "updateFilters()" in result
         assert "resetFilters()" in result
 
+    def test_dumps_json_uses_orjson_when_installed(self) -> None:
+        """Test that chart data is serialized with orjson when available."""
+        fake_orjson = Mock()
+        fake_orjson.dumps.return_value = b'{"x":[1,2]}'
+
+        with patch("csv_to_mermaid_gantt.html_visualizations._orjson", fake_orjson):
+            assert _dumps_json({"x": [1, 2]}) == '{"x":[1,2]}'
+        fake_orjson.dumps.assert_called_once_with({"x": [1, 2]})
+
+    def test_dumps_json_without_orjson(self) -> None:
+        """Test that chart data is serialized with json without orjson."""
+        data = {"x": [1, 2], "name": "Task 1"}
+
+        with patch("csv_to_mermaid_gantt.html_visualizations._orjson", None):
+            assert _dumps_json(data) == json.dumps(data)
+
+    def test_dumps_json_orjson_matches_json(self) -> None:
+        """Test that orjson and json serialize the same chart data."""
+        orjson = pytest.importorskip("orjson")
+        tasks = [
+            {
+                "task_name": 'Tâsk 1 "quoted"',
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-05",
+                "duration": "4.5d",
+            },
+        ]
+        data = {
+            "timeline": prepare_timeline_data(tasks),
+            "histogram": prepare_histogram_data(tasks),
+            "line_graph": prepare_line_graph_data(tasks),
+        }
+
+        with patch("csv_to_mermaid_gantt.html_visualizations._orjson", orjson):
+            result = _dumps_json(data)
+        assert json.loads(result) == json.loads(json.dumps(data))
+
+    def test_dumps_json_non_finite_uses_json(self) -> None:
+        """Test that data flagged as non-finite is serialized with json."""
+        fake_orjson = Mock()
+        data = {"x": ["2024-01-01 00:00:00"], "y": [float("nan")]}
+
+        with patch("csv_to_mermaid_gantt.html_visualizations._orjson", fake_orjson):
+            assert _dumps_json(data, non_finite=True) == json.dumps(data)
+        fake_orjson.dumps.assert_not_called()
+
+    def test_generate_html_keeps_non_finite_values_with_orjson(self) -> None:
+        """Test that NaN line graph values are kept when orjson is installed."""
+        orjson = pytest.importorskip("orjson")
+        csv_files_data = [
+            {
+                "name": "test.csv",
+                "tasks": [
+                    {
+                        "task_name": "Task 1",
+                        "start_date": "2024-01-01",
+                        "end_date": "2024-01-02",
+                        "duration": "nan",
+                    },
+                ],
+            }
+        ]
+
+        with patch("csv_to_mermaid_gantt.html_visualizations._orjson", orjson):
+            result = generate_html_visualization(csv_files_data)
+        assert '"values": [NaN]' in result
+
 
 class TestConvertCsvFilesToHtml:
     """Tests for convert_csv_files_to_html function."""
@@ -387,6 +490,40 @@ Task 2,2024-01-04,2024-01-06""",
         assert "file1.csv" in result
         assert "file2.csv" in result
 
+    def test_convert_csv_to_html_in_worker_processes(self) -> None:
+        """Test that files parsed in worker processes keep their input order."""
+        csv_files = [
+            {
+                "name": f"file{i}.csv",
+                "content": f"task_name,start_date,end_date\n"
+                f"Task {i},2024-01-0{i},2024-01-0{i + 1}",
+            }
+            for i in range(1, 5)
+        ]
+
+        with patch("csv_to_mermaid_gantt.html_visualizations._PARALLEL_MIN_BYTES", 0):
+            result = convert_csv_files_to_html(csv_files, max_workers=2)
+
+        for i in range(1, 5):
+            assert f'<option value="{i - 1}">file{i}.csv</option>' in result
+        assert result == convert_csv_files_to_html(csv_files)
+
+    def test_convert_csv_to_html_in_process_by_default(self) -> None:
+        """Test that no worker processes are started unless requested."""
+        csv_files = [
+            {"name": f"file{i}.csv", "content": "Name,start_timestamp\nA,2024-01-01"}
+            for i in range(1, 3)
+        ]
+
+        with patch("csv_to_mermaid_gantt.html_visualizations._PARALLEL_MIN_BYTES", 0):
+            with patch(
+                "csv_to_mermaid_gantt.html_visualizations.ProcessPoolExecutor"
+            ) as mock_executor:
+                result = convert_csv_files_to_html(csv_files)
+
+        mock_executor.assert_not_called()
+        assert "file2.csv" in result
+
     def test_convert_csv_to_html_with_options(self) -> None:
         """Test converting CSV to HTML with various options."""
         csv_files = [
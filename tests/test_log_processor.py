@@ -1,10 +1,14 @@
 """Tests for Log Processor."""
 
+import io
+from pathlib import Path
+
 import pytest
 from csv_to_mermaid_gantt.log_processor import (
     parse_log_timestamp,
     extract_connection_id,
     parse_log_csv,
+    parse_log_csv_stream,
     match_connection_events,
     convert_log_to_csv,
 )
@@ -37,6 +41,15 @@ class TestParseLogTimestamp:
         assert dt.minute == 0
         assert dt.second == 54
 
+    def test_parse_month_first_date(self) -> None:
+        """Test parsing MM/DD/YYYY dates that cannot be DD/MM/YYYY."""
+        dt = parse_log_timestamp("12/25/2025", "10:00:00")
+        assert dt is not None
+        assert dt.year == 2025
+        assert dt.month == 12
+        assert dt.day == 25
+        assert dt.hour == 10
+
     def test_parse_invalid_format(self) -> None:
         """Test parsing invalid format."""
         assert parse_log_timestamp("invalid", "13.00.54") is None
@@ -87,6 +100,109 @@ class TestParseLogCsv:
         result = parse_log_csv(csv_content)
         assert len(result) == 2
 
+    def test_parse_log_with_separator_only_rows(self) -> None:
+        """Test parsing log with rows of blank fields."""
+        csv_content = """Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr
+,,,,,,
+ , ,\t, , , ,
+18/12/2025,13.00.54,Added,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443
+ ,13.00.56,Removed,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443"""
+
+        result = parse_log_csv(csv_content)
+        assert len(result) == 2
+        assert result[1]["Action"] == "Removed"
+
+    def test_parse_log_with_leading_blank_lines(self) -> None:
+        """Test parsing log with blank lines before the header."""
+        csv_content = """
+
+Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr
+18/12/2025,13.00.54,Added,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443
+"""
+
+        result = parse_log_csv(csv_content)
+        assert len(result) == 1
+        assert result[0]["Action"] == "Added"
+
+    def test_parse_log_with_leading_whitespace_line(self) -> None:
+        """Test parsing log with a whitespace-only line before the header."""
+        csv_content = (
+            "  \n"
+            "Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr\n"
+            "18/12/2025,13.00.54,Added,processName.exe,TCP,"
+            "10.10.0.1:58100,123.123.123.123:443"
+        )
+
+        result = parse_log_csv(csv_content)
+        assert len(result) == 1
+        assert result[0]["Process"] == "processName.exe"
+
+    def test_parse_whitespace_only_log_stream(self) -> None:
+        """Test parsing a log stream containing only whitespace."""
+        with pytest.raises(ValueError, match="CSV content is empty"):
+            list(parse_log_csv_stream(io.StringIO("  \n\t\n  ")))
+
+    def test_parse_whitespace_only_csv(self) -> None:
+        """Test parsing CSV containing only whitespace."""
+        with pytest.raises(ValueError, match="CSV content is empty"):
+            parse_log_csv("  \n\r\n  ")
+
+    def test_parse_log_stream_matches_string(self, tmp_path: Path) -> None:
+        """Test parsing a log file stream gives the same entries as a string."""
+        csv_content = (
+            "Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr\r\n"
+            "18/12/2025,13.00.54,Added,processName.exe,TCP,"
+            "10.10.0.1:58100,123.123.123.123:443\r\n"
+            "\r\n"
+            "18/12/2025,13.00.56,Removed,processName.exe,TCP,"
+            "10.10.0.1:58100,123.123.123.123:443\r\n"
+        )
+        log_file = tmp_path / "log.csv"
+        log_file.write_bytes(csv_content.encode("utf-8"))
+
+        with open(log_file, newline="", encoding="utf-8") as stream:
+            result = list(parse_log_csv_stream(stream))
+
+        assert result == parse_log_csv(csv_content)
+        assert len(result) == 2
+
+    def test_parse_canonical_log_with_short_and_long_rows(self) -> None:
+        """Test that canonical rows with a wrong field count are zipped."""
+        row = (
+            "18/12/2025,13.00.54,Added,processName.exe,TCP,"
+            "10.10.0.1:58100,123.123.123.123:443\n"
+        )
+        csv_content = (
+            "Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr\n"
+            + row * 10
+            + "18/12/2025,13.00.56,Removed,processName.exe\n"
+            "18/12/2025,13.00.57,Removed,processName.exe,TCP,"
+            "10.10.0.1:58100,123.123.123.123:443,extra\n"
+        )
+
+        result = parse_log_csv(csv_content)
+        assert len(result) == 12
+        assert result[10] == {
+            "Date": "18/12/2025",
+            "Time": "13.00.56",
+            "Action": "Removed",
+            "Process": "processName.exe",
+        }
+        assert result[11] == {
+            "Date": "18/12/2025",
+            "Time": "13.00.57",
+            "Action": "Removed",
+            "Process": "processName.exe",
+            "Protocol": "TCP",
+            "LocalAddr": "10.10.0.1:58100",
+            "RemoteAddr": "123.123.123.123:443",
+        }
+
+    def test_parse_empty_log_stream(self) -> None:
+        """Test parsing an empty log stream."""
+        with pytest.raises(ValueError, match="CSV content is empty"):
+            list(parse_log_csv_stream(io.StringIO("")))
+
 
 class TestMatchConnectionEvents:
     """Tests for match_connection_events function."""
@@ -138,6 +254,18 @@ class TestMatchConnectionEvents:
         assert result[0]["start_timestamp"] == "2025-12-18 13:00:54"
         assert result[0]["end_timestamp"] == "2025-12-18 13:02:55"
 
+    def test_match_entries_from_iterator(self) -> None:
+        """Test matching entries consumed lazily from an iterator."""
+        log_content = """Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr
+18/12/2025,13.00.54,Added,processName.exe,TCP,10.10.0.1:58100,1.2.3.4:443
+18/12/2025,13.02.55,Removed,Unknown,TCP,10.10.0.1:58100,1.2.3.4:443"""
+
+        entries = iter(parse_log_csv(log_content))
+        result = match_connection_events(entries)
+        assert result == match_connection_events(parse_log_csv(log_content))
+        assert result[0]["start_timestamp"] == "2025-12-18 13:00:54"
+        assert result[0]["end_timestamp"] == "2025-12-18 13:02:55"
+
     def test_match_incomplete_removed_only(self) -> None:
         """Test handling connection with only Removed events
         (started before logging)."""
@@ -377,11 +505,30 @@ class TestConvertLogToCsv:
         assert "2025-12-18 13:00:54" in lines[1]
         assert "2025-12-18 13:02:55" in lines[1]
 
+    def test_convert_log_without_matches(self) -> None:
+        """Test converting a log with no matched connections."""
+        log_content = """Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr
+18/12/2025,13.00.54,Added,processName.exe,TCP,,123.123.123.123:443
+18/12/2025,13.00.56,Removed,processName.exe,TCP,,123.123.123.123:443"""
+
+        result = convert_log_to_csv(log_content)
+        assert result == "Name,start_timestamp,end_timestamp"
+
     def test_convert_empty_log(self) -> None:
         """Test converting empty log."""
         with pytest.raises(ValueError, match="CSV content is empty"):
             convert_log_to_csv("")
 
+    def test_convert_log_from_stream(self) -> None:
+        """Test converting log read from a text stream."""
+        log_content = """Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr
+18/12/2025,13.00.54,Added,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443
+18/12/2025,13.02.55,Removed,processName.exe,TCP,10.10.0.1:58100,123.123.123.123:443"""
+
+        result = convert_log_to_csv(io.StringIO(log_content))
+        assert result == convert_log_to_csv(log_content)
+        assert "2025-12-18 13:02:55" in result
+
     def test_convert_log_with_incomplete_data(self) -> None:
         """Test converting log with incomplete data."""
         log_content = """Date,Time,Action,Process,Protocol,LocalAddr,RemoteAddr